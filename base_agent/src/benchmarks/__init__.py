@@ -4,52 +4,79 @@
 # This source code is licensed under the MIT license found in the
 # LICENSE file in the root directory of this source tree.
 from typing import Type
+from importlib import import_module
 from collections import OrderedDict
 
 from .base import BaseBenchmark
-from .gpqa import GPQABenchmark
-from .aime import AIMEBenchmark
-from .drop import DROPBenchmark
-from .math import MATHBenchmark
-from .gsm8k import GSM8KBenchmark
-from .gsm_ic import GSMICBenchmark
-from .refute import RefuteBenchmark
-from .arc_agi import ARCAGIBenchmark
-from .humaneval import HumanEvalBenchmark
-from .file_editing import FileEditingBenchmark
-from .aiq_benchmark import AIQBenchmark
-from .livecodebench import LiveCodeBenchmark
-from .symbol_location import SymbolLocationBenchmark
-from .swebench_verified import SWEBenchBenchmark
-from .aiq_project_benchmarks import (
-    LinalgAIQBenchmark,
-    CSVParsingAIQBenchmark,
-    MessagingAppAIQBenchmark,
-    DistKVStoreAIQBenchmark,
-)
-from .data_transform import DataTransformBenchmark
+
+# Benchmark classes are only imported on first access (PEP 562), so that
+# importing this package doesn't pull in the (often heavy) dependencies of
+# every benchmark module.
+_benchmark_modules: dict[str, tuple[str, str]] = {
+    "GPQABenchmark": (".gpqa", "GPQABenchmark"),
+    "AIMEBenchmark": (".aime", "AIMEBenchmark"),
+    "DROPBenchmark": (".drop", "DROPBenchmark"),
+    "MATHBenchmark": (".math", "MATHBenchmark"),
+    "GSM8KBenchmark": (".gsm8k", "GSM8KBenchmark"),
+    "GSMICBenchmark": (".gsm_ic", "GSMICBenchmark"),
+    "RefuteBenchmark": (".refute", "RefuteBenchmark"),
+    "ARCAGIBenchmark": (".arc_agi", "ARCAGIBenchmark"),
+    "HumanEvalBenchmark": (".humaneval", "HumanEvalBenchmark"),
+    "FileEditingBenchmark": (".file_editing", "FileEditingBenchmark"),
+    "AIQBenchmark": (".aiq_benchmark", "AIQBenchmark"),
+    "LiveCodeBenchmark": (".livecodebench", "LiveCodeBenchmark"),
+    "SymbolLocationBenchmark": (".symbol_location", "SymbolLocationBenchmark"),
+    "SWEBenchBenchmark": (".swebench_verified", "SWEBenchBenchmark"),
+    "LinalgAIQBenchmark": (".aiq_project_benchmarks", "LinalgAIQBenchmark"),
+    "CSVParsingAIQBenchmark": (".aiq_project_benchmarks", "CSVParsingAIQBenchmark"),
+    "MessagingAppAIQBenchmark": (".aiq_project_benchmarks", "MessagingAppAIQBenchmark"),
+    "DistKVStoreAIQBenchmark": (".aiq_project_benchmarks", "DistKVStoreAIQBenchmark"),
+    "DataTransformBenchmark": (".data_transform", "DataTransformBenchmark"),
+}
+
+
+def _load_benchmark(name: str) -> Type[BaseBenchmark]:
+    module_path, class_name = _benchmark_modules[name]
+    benchmark_cls = getattr(import_module(module_path, __name__), class_name)
+    globals()[name] = benchmark_cls
+    return benchmark_cls
+
+
+def __getattr__(name: str):
+    if name in _benchmark_modules:
+        return _load_benchmark(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_benchmark_modules))
+
 
 benchmark_registry: OrderedDict[str, Type[BaseBenchmark]] = OrderedDict(
-    [
-        (GSM8KBenchmark.name, GSM8KBenchmark),
-        # (DROPBenchmark.name, DROPBenchmark),
-        # (ARCAGIBenchmark.name, ARCAGIBenchmark),
-        # (MATHBenchmark.name, MATHBenchmark),
-        # (GSMICBenchmark.name, GSMICBenchmark),
-        # (FileEditingBenchmark.name, FileEditingBenchmark),
-        # (SWEBenchBenchmark.name, SWEBenchBenchmark),
-        # (HumanEvalBenchmark.name, HumanEvalBenchmark),
-        # (AIMEBenchmark.name, AIMEBenchmark),
-        # (GPQABenchmark.name, GPQABenchmark),
-        # (LiveCodeBenchmark.name, LiveCodeBenchmark),
-        # (SymbolLocationBenchmark.name, SymbolLocationBenchmark),
-        # (RefuteBenchmark.name, RefuteBenchmark),
-        # (AIQBenchmark.name, AIQBenchmark),
-        # (LinalgAIQBenchmark.name, LinalgAIQBenchmark),
-        # (CSVParsingAIQBenchmark.name, CSVParsingAIQBenchmark),
-        # (MessagingAppAIQBenchmark.name, MessagingAppAIQBenchmark),
-        # (DistKVStoreAIQBenchmark.name, DistKVStoreAIQBenchmark),
-        # Example benchmark (uncomment to include in runs):
-        # (DataTransformBenchmark.name, DataTransformBenchmark),
-    ]
+    (cls.name, cls)
+    for cls in map(
+        _load_benchmark,
+        [
+            "GSM8KBenchmark",
+            # "DROPBenchmark",
+            # "ARCAGIBenchmark",
+            # "MATHBenchmark",
+            # "GSMICBenchmark",
+            # "FileEditingBenchmark",
+            # "SWEBenchBenchmark",
+            # "HumanEvalBenchmark",
+            # "AIMEBenchmark",
+            # "GPQABenchmark",
+            # "LiveCodeBenchmark",
+            # "SymbolLocationBenchmark",
+            # "RefuteBenchmark",
+            # "AIQBenchmark",
+            # "LinalgAIQBenchmark",
+            # "CSVParsingAIQBenchmark",
+            # "MessagingAppAIQBenchmark",
+            # "DistKVStoreAIQBenchmark",
+            # Example benchmark (uncomment to include in runs):
+            # "DataTransformBenchmark",
+        ],
+    )
 )
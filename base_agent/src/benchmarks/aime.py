@@ -8,7 +8,7 @@ import logging
 
 from pathlib import Path
 from datasets import load_dataset
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 
 from .base import BaseBenchmark, Problem
 
@@ -119,9 +119,11 @@ if __name__ == "__main__":
         print(f"\nTESTING: '{ground_truth}' vs '{agent_answer}' (should_pass={should_pass})")
 
         # Use first problem as template but override answer
-        problem = benchmark.problems[0]
-        problem.answer = ground_truth
-        problem.answer_discussion = "Test discussion"
+        problem = replace(
+            benchmark.problems[0],
+            answer=ground_truth,
+            answer_discussion="Test discussion",
+        )
 
         answer_file = answer_dir / "answer.txt"
         answer_file.write_text(agent_answer)
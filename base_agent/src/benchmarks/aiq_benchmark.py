@@ -35,7 +35,7 @@ logger = logging.getLogger(__name__)
 PROJECT_LIST = ["linalg", "csv_parsing", "messaging_app", "dist_kv_store"]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AIQBenchmarkProblem(Problem):
     """Problem subclass for the AIQ benchmark
 
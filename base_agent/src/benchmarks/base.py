@@ -3,23 +3,66 @@
 #
 # This source code is licensed under the MIT license found in the
 # LICENSE file in the root directory of this source tree.
+import os
+import random
 import jsonlines
 
 from abc import abstractmethod
-from typing import Any, ClassVar
+from typing import Any, ClassVar, overload
+from collections.abc import Sequence
 from pathlib import Path
 from datetime import datetime
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Problem:
-    """A single benchmark problem, containing a problem_id, problem statement and answer"""
+    """A single benchmark problem, containing a problem_id, problem statement and answer
+
+    Problems are immutable; use dataclasses.replace to derive a modified copy.
+    Subclasses must also be declared with frozen=True.
+    """
 
     problem_id: str
     statement: str
     answer: Any
     answer_discussion: str | None
+    # Optional stratum (e.g. difficulty or topic) used for subset sampling
+    category: str | None = field(default=None, kw_only=True)
+
+
+class ProblemSubset(Sequence[Problem]):
+    """A read-only view of selected problems, addressed through a list of indices
+
+    The underlying problems are not copied; only the indices are stored.
+    """
+
+    __slots__ = ("_problems", "_indices")
+
+    def __init__(self, problems: Sequence[Problem], indices: list[int]):
+        self._problems = problems
+        self._indices = indices
+
+    def __len__(self) -> int:
+        return len(self._indices)
+
+    @overload
+    def __getitem__(self, index: int) -> Problem: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "ProblemSubset": ...
+
+    def __getitem__(self, index: int | slice) -> "Problem | ProblemSubset":
+        if isinstance(index, slice):
+            return ProblemSubset(self._problems, self._indices[index])
+        return self._problems[self._indices[index]]
+
+    def __iter__(self):
+        problems = self._problems
+        return (problems[i] for i in self._indices)
+
+    def __repr__(self) -> str:
+        return f"ProblemSubset({[p.problem_id for p in self]!r})"
 
 
 @dataclass
@@ -80,6 +123,17 @@ class BenchmarkTracker:
             writer.write_all(asdict(result) for result in self.results.values())
 
 
+def read_answer(agent_answer_dir: str | Path) -> str:
+    """Read the answer.txt submitted to agent_answer_dir, stripped of whitespace.
+
+    Invalid UTF-8 is replaced rather than raising. Raises FileNotFoundError if
+    no answer was submitted. This does blocking file I/O, so run it with
+    asyncio.to_thread from async code.
+    """
+    with open(os.path.join(agent_answer_dir, "answer.txt"), "rb") as f:
+        return f.read().strip().decode("utf-8", "replace")
+
+
 class BaseBenchmark:
 
     name: ClassVar[str]
@@ -91,7 +145,7 @@ class BaseBenchmark:
 
     @property
     @abstractmethod
-    def problems(self) -> list[Problem]:
+    def problems(self) -> Sequence[Problem]:
         pass
 
     @abstractmethod
@@ -108,16 +162,50 @@ class BaseBenchmark:
         agent_answer_dir is the absolute path to the mapped logdir in the
         docker container, which should contain an answer.txt file.
 
-        To get the submitted answer (if relevant):
+        To get the submitted answer (if relevant), use read_answer, which raises
+        FileNotFoundError if the agent didn't submit one:
 
-        answer_path = Path(agent_answer_dir) / "answer.txt"
-        llm_answer = answer_path.read_text().strip()
+        llm_answer = await asyncio.to_thread(read_answer, agent_answer_dir)
 
         Return the score (as a float), any parsing errors, and any additional
         discussion or information about the answer that can assist the summary.
         """
         pass
 
+    def sample_problems(self, problems: Sequence[Problem]) -> Sequence[Problem]:
+        """Draw a seeded subset of subset_size problems, stratified by category.
+
+        Each category receives a share of the subset proportional to its size
+        (using largest-remainder rounding), and problems are drawn uniformly
+        within each category. Problems without a category form a single
+        stratum, so uncategorised benchmarks get a plain uniform sample.
+
+        Returns the problems unchanged if no subset is requested, or if the
+        subset would cover all of them. Otherwise returns a ProblemSubset view
+        over the sampled indices, so no problems are copied.
+        """
+        if self.subset_size is None or self.subset_size >= len(problems):
+            return problems
+
+        strata: dict[str | None, list[int]] = {}
+        for i, problem in enumerate(problems):
+            strata.setdefault(problem.category, []).append(i)
+
+        total, size = len(problems), self.subset_size
+        quotas = {key: size * len(idx) // total for key, idx in strata.items()}
+        shortfall = size - sum(quotas.values())
+        by_remainder = sorted(
+            strata, key=lambda key: size * len(strata[key]) % total, reverse=True
+        )
+        for key in by_remainder[:shortfall]:
+            quotas[key] += 1
+
+        rng = random.Random(self.seed)
+        indices = [
+            i for key, idx in strata.items() for i in rng.sample(idx, quotas[key])
+        ]
+        return ProblemSubset(problems, indices)
+
     def get_problem(self, problem_id: str) -> Problem | None:
         """Retrieve a specific problem by ID
         Overload this method if there is a more efficient way of locating the
@@ -133,6 +221,11 @@ class BaseBenchmark:
         This is called before each problem is run. The problem_data_dir
         will be mounted in the agent's container at /home/agent/workdir.
 
+        The directory is ephemeral: it is created empty for each run, removed
+        once the problem has been scored, and may live on a tmpfs mount (see
+        the runner's --problem-data-dir option). Only use it for fixtures that
+        can be regenerated, and don't rely on it across problems.
+
         Args:
             problem: The problem being run
             problem_data_dir: Path to a temporary directory for problem data.
@@ -140,3 +233,11 @@ class BaseBenchmark:
             container_name: The name of the container that the problem will run in
         """
         pass  # Default no-op implementation
+
+    async def aclose(self) -> None:
+        """Optional hook for releasing resources once all problems are done.
+
+        The runner calls this after the last problem of a run has been scored,
+        before the benchmark is discarded.
+        """
+        pass  # Default no-op implementation
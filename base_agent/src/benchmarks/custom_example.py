@@ -11,16 +11,52 @@ This example shows how to create a benchmark for a customized workflow.
 Adapt this template to your specific needs.
 """
 
-import json
-import random
+import asyncio
 import logging
 from pathlib import Path
-from typing import Any
+from functools import partial
+from typing import Any, Awaitable, Callable, Iterable
+from collections.abc import Sequence
 
-from .base import BaseBenchmark, Problem
+from .base import BaseBenchmark, Problem, read_answer
+from ..utils import fast_json
 
 logger = logging.getLogger(__name__)
 
+# (problem, workdir, submitted_answer) -> (score, error, discussion)
+Scorer = Callable[[Problem, Path, str], Awaitable[tuple[float, str | None, str | None]]]
+
+# Sample problems, used when there is no data file
+_SAMPLE_PROBLEMS: tuple[Problem, ...] = (
+    Problem(
+        problem_id="demo_1",
+        statement="Calculate the sum of 42 and 58. Submit only the numeric answer.",
+        answer=100,
+        answer_discussion="42 + 58 = 100"
+    ),
+    Problem(
+        problem_id="demo_2",
+        statement="What is the capital of France? Submit your answer as a single word.",
+        answer="Paris",
+        answer_discussion="The capital city of France is Paris."
+    ),
+    Problem(
+        problem_id="demo_3",
+        statement="Write a Python function called 'add_numbers' that takes two integers and returns their sum. Save it to solution.py.",
+        answer="def add_numbers(a, b):\n    return a + b",
+        answer_discussion="A simple function that adds two numbers."
+    ),
+)
+
+_FILE_PROCESSING_PROBLEMS: tuple[Problem, ...] = (
+    Problem(
+        problem_id="csv_processing",
+        statement="Read data.csv, calculate the average of the 'value' column, and save the result to output.txt",
+        answer=42.5,  # Expected average
+        answer_discussion="The average should be calculated from all valid numeric values"
+    ),
+)
+
 
 class CustomWorkflowBenchmark(BaseBenchmark):
     """
@@ -57,10 +93,27 @@ class CustomWorkflowBenchmark(BaseBenchmark):
         
         self._problems = self._load_problems(data_path)
         
-        # Apply subset sampling if requested
-        if subset_size is not None and subset_size < len(self._problems):
-            random.seed(seed)
-            self._problems = random.sample(self._problems, subset_size)
+        # Apply subset sampling if requested; this is stratified by each
+        # problem's category, if the data provides one
+        self._problems = self.sample_problems(self._problems)
+        
+        # Index problems by ID and resolve each problem's scorer once, so
+        # lookups and scoring dispatch are a single dict access
+        self._problem_map = {p.problem_id: p for p in self._problems}
+        self._scorers = {p.problem_id: self._select_scorer(p) for p in self._problems}
+        
+        # Expected answers for exact-match scoring, casefolded once up front
+        self._folded_answers = {
+            p.problem_id: p.answer.casefold()
+            for p in self._problems
+            if isinstance(p.answer, str)
+        }
+        
+        # problem_id -> setup function, for problems that need input files.
+        # These do blocking file I/O, so they're run in a worker thread.
+        self._setup_handlers = {
+            "demo_file_task": self._setup_demo_file_task,
+        }
 
     def _load_problems(self, data_path: Path) -> list[Problem]:
         """
@@ -74,20 +127,11 @@ class CustomWorkflowBenchmark(BaseBenchmark):
         5. API call
         6. Generated programmatically
         """
-        problems = []
-        
         # Example 1: Load from JSONL file
         data_file = Path(data_path) / "problems.jsonl"
         if data_file.exists():
-            with open(data_file, 'r') as f:
-                for i, line in enumerate(f):
-                    data = json.loads(line)
-                    problems.append(Problem(
-                        problem_id=data.get("id", str(i)),
-                        statement=data["question"],
-                        answer=data["expected_answer"],
-                        answer_discussion=data.get("explanation", None)
-                    ))
+            with open(data_file, "rb") as f:
+                problems = self._parse_problems(iter(partial(f.read, 1 << 16), b""))
         
         # Example 2: Generate synthetic problems for demonstration
         else:
@@ -96,32 +140,31 @@ class CustomWorkflowBenchmark(BaseBenchmark):
         
         return problems
 
-    def _generate_sample_problems(self) -> list[Problem]:
-        """Generate sample problems for demonstration purposes."""
+    def _parse_problems(self, chunks: Iterable[bytes]) -> list[Problem]:
+        """
+        Build problems from JSONL content supplied as a stream of byte chunks.
+        
+        The chunks can come from a file, a pipe or an HTTP response body; they
+        don't need to be aligned to line boundaries.
+        """
         return [
             Problem(
-                problem_id="demo_1",
-                statement="Calculate the sum of 42 and 58. Submit only the numeric answer.",
-                answer=100,
-                answer_discussion="42 + 58 = 100"
-            ),
-            Problem(
-                problem_id="demo_2",
-                statement="What is the capital of France? Submit your answer as a single word.",
-                answer="Paris",
-                answer_discussion="The capital city of France is Paris."
-            ),
-            Problem(
-                problem_id="demo_3",
-                statement="Write a Python function called 'add_numbers' that takes two integers and returns their sum. Save it to solution.py.",
-                answer="def add_numbers(a, b):\n    return a + b",
-                answer_discussion="A simple function that adds two numbers."
-            ),
+                problem_id=data.get("id", str(i)),
+                statement=data["question"],
+                answer=data["expected_answer"],
+                answer_discussion=data.get("explanation", None),
+                category=data.get("category", None),
+            )
+            for i, data in enumerate(fast_json.iter_jsonl(chunks))
         ]
 
+    def _generate_sample_problems(self) -> list[Problem]:
+        """Generate sample problems for demonstration purposes."""
+        return list(_SAMPLE_PROBLEMS)
+
     @property
-    def problems(self) -> list[Problem]:
-        """Return the list of problems in this benchmark."""
+    def problems(self) -> Sequence[Problem]:
+        """Return the problems in this benchmark."""
         return self._problems
 
     async def setup_problem(
@@ -141,17 +184,21 @@ class CustomWorkflowBenchmark(BaseBenchmark):
         
         The problem_data_dir will be mounted at /home/agent/workdir in the container.
         """
-        # Example: Create a test input file for the agent
-        if problem.problem_id == "demo_file_task":
-            input_file = problem_data_dir / "input.txt"
-            input_file.write_text("Some input data for the agent to process")
-            
-            # Create subdirectories if needed
-            (problem_data_dir / "data").mkdir(exist_ok=True)
+        handler = self._setup_handlers.get(problem.problem_id)
+        if handler is not None:
+            await asyncio.to_thread(handler, problem, problem_data_dir)
             
         # You can also execute commands in the container if needed
         # (would require additional Docker API calls)
 
+    def _setup_demo_file_task(self, problem: Problem, problem_data_dir: Path) -> None:
+        # Example: Create a test input file for the agent
+        input_file = problem_data_dir / "input.txt"
+        input_file.write_text("Some input data for the agent to process")
+        
+        # Create subdirectories if needed
+        (problem_data_dir / "data").mkdir(exist_ok=True)
+
     async def score_problem(
         self,
         problem: Problem,
@@ -175,63 +222,90 @@ class CustomWorkflowBenchmark(BaseBenchmark):
             - discussion: Additional context about the answer
         """
         try:
-            # Read the agent's submitted answer
-            answer_path = Path(agent_answer_dir) / "answer.txt"
-            
-            if not answer_path.exists():
+            # Read the agent's submitted answer, in a single read
+            try:
+                submitted_answer = await asyncio.to_thread(read_answer, agent_answer_dir)
+            except FileNotFoundError:
                 return 0.0, "No answer.txt file found", None
             
-            submitted_answer = answer_path.read_text().strip()
-            
-            # Option 1: Exact match scoring
-            if isinstance(problem.answer, str):
-                score = 1.0 if submitted_answer.lower() == problem.answer.lower() else 0.0
-                return score, None, problem.answer_discussion
-            
-            # Option 2: Numeric comparison with tolerance
-            elif isinstance(problem.answer, (int, float)):
-                try:
-                    submitted_value = float(submitted_answer.replace(",", ""))
-                    if abs(submitted_value - problem.answer) < 1e-6:
-                        return 1.0, None, problem.answer_discussion
-                    else:
-                        error = f"Expected {problem.answer}, got {submitted_value}"
-                        return 0.0, error, problem.answer_discussion
-                except ValueError as e:
-                    return 0.0, f"Could not parse numeric answer: {e}", None
-            
-            # Option 3: Check for a file output (e.g., code file)
-            elif problem.problem_id == "demo_3":
-                solution_file = Path(agent_workdir) / "solution.py"
-                if not solution_file.exists():
-                    return 0.0, "solution.py not found", None
-                
-                code = solution_file.read_text()
-                
-                # Basic checks
-                if "def add_numbers" in code and "return" in code:
-                    # Could run more sophisticated tests here
-                    # e.g., import and test the function
-                    return 1.0, None, "Function found and appears correct"
-                else:
-                    return 0.0, "Function definition incomplete", None
-            
-            # Default: No match
-            return 0.0, "Unexpected answer format", None
+            # The scorer resolved in __init__ only applies to the indexed
+            # problem itself, not to one derived from it with replace()
+            if self._problem_map.get(problem.problem_id) is problem:
+                scorer = self._scorers[problem.problem_id]
+            else:
+                scorer = self._select_scorer(problem)
+            return await scorer(problem, Path(agent_workdir), submitted_answer)
             
         except Exception as e:
             logger.error(f"Error scoring problem {problem.problem_id}: {e}")
             return 0.0, str(e), None
 
+    def _select_scorer(self, problem: Problem) -> Scorer:
+        """Pick the scoring coroutine for a problem based on its answer."""
+        # Option 1: Exact match scoring
+        if isinstance(problem.answer, str):
+            return self._score_exact_match
+        # Option 2: Numeric comparison with tolerance
+        elif isinstance(problem.answer, (int, float)):
+            return self._score_numeric
+        # Option 3: Check for a file output (e.g., code file)
+        elif problem.problem_id == "demo_3":
+            return self._score_solution_file
+        # Default: No match
+        return self._score_unexpected
+
+    async def _score_exact_match(
+        self, problem: Problem, workdir: Path, submitted_answer: str
+    ) -> tuple[float, str | None, str | None]:
+        if self._problem_map.get(problem.problem_id) is problem:
+            expected = self._folded_answers[problem.problem_id]
+        else:
+            expected = problem.answer.casefold()
+        score = 1.0 if submitted_answer.casefold() == expected else 0.0
+        return score, None, problem.answer_discussion
+
+    async def _score_numeric(
+        self, problem: Problem, workdir: Path, submitted_answer: str
+    ) -> tuple[float, str | None, str | None]:
+        try:
+            submitted_value = float(submitted_answer.replace(",", ""))
+            if abs(submitted_value - problem.answer) < 1e-6:
+                return 1.0, None, problem.answer_discussion
+            else:
+                error = f"Expected {problem.answer}, got {submitted_value}"
+                return 0.0, error, problem.answer_discussion
+        except ValueError as e:
+            return 0.0, f"Could not parse numeric answer: {e}", None
+
+    async def _score_solution_file(
+        self, problem: Problem, workdir: Path, submitted_answer: str
+    ) -> tuple[float, str | None, str | None]:
+        try:
+            code = await asyncio.to_thread((workdir / "solution.py").read_text)
+        except FileNotFoundError:
+            return 0.0, "solution.py not found", None
+        
+        # Basic checks
+        if "def add_numbers" in code and "return" in code:
+            # Could run more sophisticated tests here
+            # e.g., import and test the function
+            return 1.0, None, "Function found and appears correct"
+        else:
+            return 0.0, "Function definition incomplete", None
+
+    async def _score_unexpected(
+        self, problem: Problem, workdir: Path, submitted_answer: str
+    ) -> tuple[float, str | None, str | None]:
+        return 0.0, "Unexpected answer format", None
+
     def get_problem(self, problem_id: str) -> Problem | None:
         """
         Optional: Override for more efficient problem lookup.
         
-        Default implementation does linear search, but you can optimize
-        if you have many problems (e.g., use a dictionary).
+        Default implementation does linear search; here we use the
+        problem_id -> Problem dictionary built in __init__.
         """
-        # Default implementation from base class works fine for most cases
-        return super().get_problem(problem_id)
+        return self._problem_map.get(problem_id)
 
 
 # Alternative: More complex example with file-based evaluation
@@ -244,19 +318,16 @@ class FileProcessingBenchmark(BaseBenchmark):
     
     def __init__(self, seed: int | None = None, subset_size: int | None = None):
         super().__init__(seed, subset_size)
-        self._problems = [
-            Problem(
-                problem_id="csv_processing",
-                statement="Read data.csv, calculate the average of the 'value' column, and save the result to output.txt",
-                answer=42.5,  # Expected average
-                answer_discussion="The average should be calculated from all valid numeric values"
-            )
-        ]
+        self._problems = list(_FILE_PROCESSING_PROBLEMS)
+        self._problem_map = {p.problem_id: p for p in self._problems}
     
     @property
     def problems(self) -> list[Problem]:
         return self._problems
     
+    def get_problem(self, problem_id: str) -> Problem | None:
+        return self._problem_map.get(problem_id)
+    
     async def setup_problem(
         self,
         problem: Problem,
@@ -266,7 +337,7 @@ class FileProcessingBenchmark(BaseBenchmark):
         """Create input files for the agent."""
         if problem.problem_id == "csv_processing":
             csv_content = "name,value\nA,40\nB,45\nC,42.5"
-            (problem_data_dir / "data.csv").write_text(csv_content)
+            await asyncio.to_thread((problem_data_dir / "data.csv").write_text, csv_content)
     
     async def score_problem(
         self,
@@ -277,11 +348,12 @@ class FileProcessingBenchmark(BaseBenchmark):
     ) -> tuple[float, str | None, str | None]:
         """Check the output file produced by the agent."""
         try:
-            output_file = Path(agent_workdir) / "output.txt"
-            if not output_file.exists():
+            try:
+                output = await asyncio.to_thread((Path(agent_workdir) / "output.txt").read_text)
+            except FileNotFoundError:
                 return 0.0, "output.txt not found", None
             
-            result = float(output_file.read_text().strip())
+            result = float(output.strip())
             
             if abs(result - problem.answer) < 0.01:
                 return 1.0, None, problem.answer_discussion
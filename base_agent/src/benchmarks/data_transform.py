@@ -4,15 +4,111 @@
 # This source code is licensed under the MIT license found in the
 # LICENSE file in the root directory of this source tree.
 
-import json
+import os
+import asyncio
 import logging
 from pathlib import Path
-from typing import ClassVar
+from functools import lru_cache
+from typing import Any, ClassVar
+from collections.abc import Sequence
 
-from .base import BaseBenchmark, Problem
+from .base import BaseBenchmark, Problem, read_answer
+from ..utils import fast_json
 
 logger = logging.getLogger(__name__)
 
+# The problem fixtures are constant, so serialise them once at import rather
+# than on every setup_problem call.
+
+# Sample CSV file
+_CSV_BYTES = b"name,age,city\nAlice,30,NYC\nBob,25,LA\nCharlie,35,Chicago"
+
+# Sample JSON with users
+_FILTER_JSON_BYTES = fast_json.dumps(
+    [
+        {"name": "Alice", "age": 25},
+        {"name": "Bob", "age": 17},
+        {"name": "Charlie", "age": 30},
+        {"name": "David", "age": 16},
+    ],
+    indent=True,
+)
+
+# Sample transactions
+_TX_JSON_BYTES = fast_json.dumps(
+    [
+        {"id": 1, "amount": 50.25},
+        {"id": 2, "amount": 100.00},
+        {"id": 3, "amount": 75.50},
+        {"id": 4, "amount": 25.00},
+    ],
+    indent=True,
+)
+
+# Fields every object in the csv_to_json output must contain
+_REQUIRED_CSV_FIELDS = frozenset({"name", "age", "city"})
+
+# Characters a plain decimal number can start with
+_NUMBER_START = frozenset("+-.0123456789")
+
+# problem_id -> (filename, payload) written to the problem data directory
+_PROBLEM_FILES: dict[str, tuple[str, bytes]] = {
+    "csv_to_json": ("input.csv", _CSV_BYTES),
+    "filter_data": ("data.json", _FILTER_JSON_BYTES),
+    "aggregate_sum": ("transactions.json", _TX_JSON_BYTES),
+}
+
+_DATA_TRANSFORM_PROBLEMS: tuple[Problem, ...] = (
+    Problem(
+        problem_id="csv_to_json",
+        statement=(
+            "You are given a CSV file at 'input.csv' with columns: name, age, city.\n"
+            "Convert it to a JSON file called 'output.json' with the same data.\n"
+            "Each row should be an object in a JSON array.\n\n"
+            "When done, write 'COMPLETED' to answer.txt"
+        ),
+        answer="COMPLETED",
+        answer_discussion="Should convert CSV to JSON array format"
+    ),
+    Problem(
+        problem_id="filter_data",
+        statement=(
+            "You are given a JSON file at 'data.json' containing a list of users.\n"
+            "Filter out all users where age < 18 and save to 'filtered.json'.\n\n"
+            "When done, write 'COMPLETED' to answer.txt"
+        ),
+        answer="COMPLETED",
+        answer_discussion="Should filter users by age >= 18"
+    ),
+    Problem(
+        problem_id="aggregate_sum",
+        statement=(
+            "You are given a JSON file at 'transactions.json' with transactions.\n"
+            "Each transaction has an 'amount' field.\n"
+            "Calculate the total sum of all amounts and write just the number to answer.txt"
+        ),
+        answer=250.75,  # Expected sum
+        answer_discussion="Sum of all transaction amounts"
+    ),
+)
+
+
+@lru_cache(maxsize=128)
+def _parse_json_file(path: str, mtime_ns: int, size: int) -> Any:
+    # The stat fields are part of the cache key, so a rewritten file is re-read
+    with open(path, "rb") as f:
+        return fast_json.loads(f.read())
+
+
+def _load_json_output(path: Path) -> Any:
+    """Parse a JSON output file, reusing the last parse if it hasn't changed.
+
+    Raises FileNotFoundError if the file doesn't exist. The parsed value may be
+    shared between calls, so it must not be modified.
+    """
+    st = os.stat(path)
+    return _parse_json_file(os.fspath(path), st.st_mtime_ns, st.st_size)
+
 
 class DataTransformBenchmark(BaseBenchmark):
     """Benchmark for testing data transformation capabilities.
@@ -29,44 +125,26 @@ class DataTransformBenchmark(BaseBenchmark):
         super().__init__(seed, subset_size)
         
         # Define your problems directly in code for simple benchmarks
-        self._problems = [
-            Problem(
-                problem_id="csv_to_json",
-                statement=(
-                    "You are given a CSV file at 'input.csv' with columns: name, age, city.\n"
-                    "Convert it to a JSON file called 'output.json' with the same data.\n"
-                    "Each row should be an object in a JSON array.\n\n"
-                    "When done, write 'COMPLETED' to answer.txt"
-                ),
-                answer="COMPLETED",
-                answer_discussion="Should convert CSV to JSON array format"
-            ),
-            Problem(
-                problem_id="filter_data",
-                statement=(
-                    "You are given a JSON file at 'data.json' containing a list of users.\n"
-                    "Filter out all users where age < 18 and save to 'filtered.json'.\n\n"
-                    "When done, write 'COMPLETED' to answer.txt"
-                ),
-                answer="COMPLETED",
-                answer_discussion="Should filter users by age >= 18"
-            ),
-            Problem(
-                problem_id="aggregate_sum",
-                statement=(
-                    "You are given a JSON file at 'transactions.json' with transactions.\n"
-                    "Each transaction has an 'amount' field.\n"
-                    "Calculate the total sum of all amounts and write just the number to answer.txt"
-                ),
-                answer=250.75,  # Expected sum
-                answer_discussion="Sum of all transaction amounts"
-            ),
-        ]
+        self._problems = self.sample_problems(_DATA_TRANSFORM_PROBLEMS)
+        self._problem_map = {p.problem_id: p for p in self._problems}
+        
+        # problem_id -> scoring coroutine
+        self._scorers = {
+            "csv_to_json": self._score_csv_to_json,
+            "filter_data": self._score_filter_data,
+            "aggregate_sum": self._score_aggregate_sum,
+        }
+        
+        # Parsed outputs are only reused within a run
+        _parse_json_file.cache_clear()
     
     @property
-    def problems(self) -> list[Problem]:
+    def problems(self) -> Sequence[Problem]:
         return self._problems
     
+    def get_problem(self, problem_id: str) -> Problem | None:
+        return self._problem_map.get(problem_id)
+    
     async def setup_problem(
         self, 
         problem: Problem, 
@@ -75,32 +153,11 @@ class DataTransformBenchmark(BaseBenchmark):
     ) -> None:
         """Create test data files for each problem."""
         
-        if problem.problem_id == "csv_to_json":
-            # Create sample CSV file
-            csv_content = "name,age,city\nAlice,30,NYC\nBob,25,LA\nCharlie,35,Chicago"
-            (problem_data_dir / "input.csv").write_text(csv_content)
-            
-        elif problem.problem_id == "filter_data":
-            # Create sample JSON with users
-            data = [
-                {"name": "Alice", "age": 25},
-                {"name": "Bob", "age": 17},
-                {"name": "Charlie", "age": 30},
-                {"name": "David", "age": 16},
-            ]
-            (problem_data_dir / "data.json").write_text(json.dumps(data, indent=2))
-            
-        elif problem.problem_id == "aggregate_sum":
-            # Create sample transactions
-            transactions = [
-                {"id": 1, "amount": 50.25},
-                {"id": 2, "amount": 100.00},
-                {"id": 3, "amount": 75.50},
-                {"id": 4, "amount": 25.00},
-            ]
-            (problem_data_dir / "transactions.json").write_text(
-                json.dumps(transactions, indent=2)
-            )
+        problem_file = _PROBLEM_FILES.get(problem.problem_id)
+        if problem_file is not None:
+            filename, payload = problem_file
+            # Keep the event loop free so that problems can be set up concurrently
+            await asyncio.to_thread((problem_data_dir / filename).write_bytes, payload)
     
     async def score_problem(
         self,
@@ -112,69 +169,84 @@ class DataTransformBenchmark(BaseBenchmark):
         """Score the agent's solution."""
         
         try:
-            # Get the submitted answer
-            answer_path = Path(agent_answer_dir) / "answer.txt"
-            if not answer_path.exists():
+            # Get the submitted answer, in a single read
+            try:
+                agent_answer = await asyncio.to_thread(read_answer, agent_answer_dir)
+            except FileNotFoundError:
                 return 0.0, "No answer.txt file found", problem.answer_discussion
             
-            agent_answer = answer_path.read_text().strip()
-            
             # Problem-specific scoring
-            if problem.problem_id == "csv_to_json":
-                output_path = Path(agent_workdir) / "output.json"
-                if not output_path.exists():
-                    return 0.0, "output.json not found", problem.answer_discussion
-                
-                try:
-                    output_data = json.loads(output_path.read_text())
-                    # Check if it's a list with 3 items (our CSV had 3 rows)
-                    if isinstance(output_data, list) and len(output_data) == 3:
-                        # Check if all required fields are present
-                        required_fields = {"name", "age", "city"}
-                        if all(required_fields.issubset(item.keys()) for item in output_data):
-                            return 1.0, None, problem.answer_discussion
-                        else:
-                            return 0.5, "Missing required fields", problem.answer_discussion
-                    else:
-                        return 0.3, "Incorrect data structure", problem.answer_discussion
-                except json.JSONDecodeError:
-                    return 0.0, "Invalid JSON output", problem.answer_discussion
-            
-            elif problem.problem_id == "filter_data":
-                filtered_path = Path(agent_workdir) / "filtered.json"
-                if not filtered_path.exists():
-                    return 0.0, "filtered.json not found", problem.answer_discussion
-                
-                try:
-                    filtered_data = json.loads(filtered_path.read_text())
-                    # Should have 2 users (Alice: 25, Charlie: 30)
-                    if len(filtered_data) == 2:
-                        # Check all are 18+
-                        if all(user.get("age", 0) >= 18 for user in filtered_data):
-                            return 1.0, None, problem.answer_discussion
-                        else:
-                            return 0.5, "Some users don't meet age requirement", problem.answer_discussion
-                    else:
-                        return 0.3, f"Expected 2 users, got {len(filtered_data)}", problem.answer_discussion
-                except json.JSONDecodeError:
-                    return 0.0, "Invalid JSON output", problem.answer_discussion
-            
-            elif problem.problem_id == "aggregate_sum":
-                try:
-                    # Agent should write just the sum
-                    agent_sum = float(agent_answer)
-                    expected_sum = problem.answer
-                    
-                    # Allow small floating point errors
-                    if abs(agent_sum - expected_sum) < 0.01:
-                        return 1.0, None, problem.answer_discussion
-                    else:
-                        return 0.0, f"Expected {expected_sum}, got {agent_sum}", problem.answer_discussion
-                except ValueError:
-                    return 0.0, f"Could not parse answer as number: {agent_answer}", problem.answer_discussion
-            
-            return 0.0, "Unknown problem ID", problem.answer_discussion
+            scorer = self._scorers.get(problem.problem_id)
+            if scorer is None:
+                return 0.0, "Unknown problem ID", problem.answer_discussion
+            return await scorer(problem, Path(agent_workdir), agent_answer)
             
         except Exception as e:
             logger.error(f"Error scoring problem {problem.problem_id}: {e}")
             return 0.0, str(e), problem.answer_discussion
+    
+    async def _score_csv_to_json(
+        self, problem: Problem, workdir: Path, agent_answer: str
+    ) -> tuple[float, str | None, str | None]:
+        try:
+            output_data = await asyncio.to_thread(_load_json_output, workdir / "output.json")
+        except FileNotFoundError:
+            return 0.0, "output.json not found", problem.answer_discussion
+        except fast_json.JSONDecodeError:
+            return 0.0, "Invalid JSON output", problem.answer_discussion
+        
+        # Check if it's a list with 3 items (our CSV had 3 rows). Checking the
+        # length first bounds the per-item work below, however large the
+        # agent's output is.
+        if isinstance(output_data, list) and len(output_data) == 3:
+            # Check if all required fields are present
+            if all(_REQUIRED_CSV_FIELDS <= item.keys() for item in output_data):
+                return 1.0, None, problem.answer_discussion
+            else:
+                return 0.5, "Missing required fields", problem.answer_discussion
+        else:
+            return 0.3, "Incorrect data structure", problem.answer_discussion
+    
+    async def _score_filter_data(
+        self, problem: Problem, workdir: Path, agent_answer: str
+    ) -> tuple[float, str | None, str | None]:
+        try:
+            filtered_data = await asyncio.to_thread(_load_json_output, workdir / "filtered.json")
+        except FileNotFoundError:
+            return 0.0, "filtered.json not found", problem.answer_discussion
+        except fast_json.JSONDecodeError:
+            return 0.0, "Invalid JSON output", problem.answer_discussion
+        
+        # Should have 2 users (Alice: 25, Charlie: 30); as above, check the
+        # length before looking at any of the users
+        num_users = len(filtered_data)
+        if num_users == 2:
+            # Check all are 18+
+            if all(user.get("age", 0) >= 18 for user in filtered_data):
+                return 1.0, None, problem.answer_discussion
+            else:
+                return 0.5, "Some users don't meet age requirement", problem.answer_discussion
+        else:
+            return 0.3, f"Expected 2 users, got {num_users}", problem.answer_discussion
+    
+    async def _score_aggregate_sum(
+        self, problem: Problem, workdir: Path, agent_answer: str
+    ) -> tuple[float, str | None, str | None]:
+        # Only this problem's score depends on the submitted answer itself.
+        # Agent should write just the sum, possibly with thousands separators.
+        # Anything not starting like a number is rejected without going
+        # through float() and its exception.
+        number = agent_answer.replace(",", "")
+        if not number or number[0] not in _NUMBER_START:
+            return 0.0, f"Could not parse answer as number: {agent_answer}", problem.answer_discussion
+        try:
+            agent_sum = float(number)
+            expected_sum = problem.answer
+            
+            # Allow small floating point errors
+            if abs(agent_sum - expected_sum) < 0.01:
+                return 1.0, None, problem.answer_discussion
+            else:
+                return 0.0, f"Expected {expected_sum}, got {agent_sum}", problem.answer_discussion
+        except ValueError:
+            return 0.0, f"Could not parse answer as number: {agent_answer}", problem.answer_discussion
@@ -15,14 +15,17 @@ where the agent needs to:
 - Verify changes were made correctly
 """
 
-import json
+import os
+import time
 import logging
 import asyncio
 from pathlib import Path
-from typing import Any
+from typing import Any, Awaitable, Callable, Iterable
+from collections.abc import Sequence
 from dataclasses import dataclass
 
-from .base import BaseBenchmark, Problem
+from .base import BaseBenchmark, Problem, read_answer
+from ..utils import fast_json
 
 logger = logging.getLogger(__name__)
 
@@ -34,14 +37,112 @@ class ERPClient:
     Examples: Odoo's xmlrpc, SAP's REST API, custom database access, etc.
     """
     
-    def __init__(self, base_url: str, api_key: str, database: str = None):
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str,
+        database: str = None,
+        cache_ttl: float = 30.0,
+        cache_size: int = 512,
+    ):
         self.base_url = base_url
         self.api_key = api_key
         self.database = database
         # In real implementation: initialize your ERP connection
+        
+        # Reads are cached for cache_ttl seconds, so that re-scoring a problem
+        # doesn't repeat its round-trips. Writes through this client drop the
+        # affected entries once they complete. Cached records are shared and
+        # must not be modified.
+        self.cache_ttl = cache_ttl
+        self.cache_size = cache_size
+        self._cache: dict[tuple, tuple[float, Any]] = {}
+        self._cache_locks: dict[tuple, asyncio.Lock] = {}
+        # Fetches in progress and the invalidations made meanwhile, keyed by
+        # (model, entity_id) for records and by ("search", model) for all
+        # searches of a model. Entries are dropped once no fetch is in progress.
+        self._fetching: dict[tuple, int] = {}
+        self._generations: dict[tuple, int] = {}
+    
+    async def _cached(self, key: tuple, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """Return the cached value for key, or fetch and cache it."""
+        # One lock per key, so concurrent reads of different entities don't
+        # wait on each other, and concurrent reads of one entity fetch it once
+        lock = self._cache_locks.setdefault(key, asyncio.Lock())
+        try:
+            async with lock:
+                entry = self._cache.get(key)
+                if entry is not None and entry[0] > time.monotonic():
+                    return entry[1]
+                
+                value, invalidated = await self._fetch(key[:2], fetch)
+                self._cache.pop(key, None)
+                if invalidated or self.cache_size <= 0:
+                    # Either caching is off, or a write landed while fetching so
+                    # the value may predate it; return it without caching it
+                    return value
+                
+                while len(self._cache) >= self.cache_size:
+                    oldest = next(iter(self._cache))
+                    del self._cache[oldest]
+                    self._cache_locks.pop(oldest, None)
+                self._cache[key] = (time.monotonic() + self.cache_ttl, value)
+                return value
+        finally:
+            # Only keep locks for cached keys, so they don't pile up for reads
+            # that failed or weren't cached
+            if key not in self._cache and self._cache_locks.get(key) is lock:
+                del self._cache_locks[key]
+    
+    async def _fetch(
+        self, generation_key: tuple, fetch: Callable[[], Awaitable[Any]]
+    ) -> tuple[Any, bool]:
+        """Fetch a value, and whether generation_key was invalidated meanwhile."""
+        self._fetching[generation_key] = self._fetching.get(generation_key, 0) + 1
+        generation = self._generations.get(generation_key, 0)
+        try:
+            value = await fetch()
+            return value, self._generations.get(generation_key, 0) != generation
+        finally:
+            remaining = self._fetching.pop(generation_key) - 1
+            if remaining:
+                self._fetching[generation_key] = remaining
+            else:
+                self._generations.pop(generation_key, None)
+    
+    def invalidate(self, model: str, entity_id: str | None = None) -> None:
+        """Drop cached reads of an entity, and any cached searches of its model."""
+        searches = ("search", model)
+        keys = [k for k in self._cache_locks.keys() | self._cache.keys() if k[:2] == searches]
+        generation_keys = [searches]
+        if entity_id is not None:
+            keys.append((model, entity_id))
+            generation_keys.append((model, entity_id))
+        
+        # Only fetches in progress can be made stale by this write
+        for key in generation_keys:
+            if key in self._fetching:
+                self._generations[key] = self._generations.get(key, 0) + 1
+        for key in keys:
+            self._cache.pop(key, None)
+            self._cache_locks.pop(key, None)
+    
+    async def aclose(self) -> None:
+        """Close the connection to the ERP system."""
+        pass  # Mock - nothing to close
+    
+    def clear_cache(self) -> None:
+        """Drop all cached reads."""
+        self._cache.clear()
+        self._cache_locks.clear()
     
     async def get_sale_order(self, order_id: str) -> dict:
         """Retrieve a sale order from the ERP system."""
+        return await self._cached(
+            ("sale.order", order_id), lambda: self._fetch_sale_order(order_id)
+        )
+    
+    async def _fetch_sale_order(self, order_id: str) -> dict:
         # Mock implementation - replace with actual API call
         # Example for Odoo:
         # return self.odoo_client.execute_kw(
@@ -58,12 +159,23 @@ class ERPClient:
     
     async def update_sale_order(self, order_id: str, values: dict) -> bool:
         """Update a sale order."""
+        try:
+            return await self._write_sale_order(order_id, values)
+        finally:
+            self.invalidate("sale.order", order_id)
+    
+    async def _write_sale_order(self, order_id: str, values: dict) -> bool:
         # Mock - replace with actual update
         logger.info(f"Updating order {order_id} with {values}")
         return True
     
     async def get_invoice(self, invoice_id: str) -> dict:
         """Retrieve an invoice."""
+        return await self._cached(
+            ("account.move", invoice_id), lambda: self._fetch_invoice(invoice_id)
+        )
+    
+    async def _fetch_invoice(self, invoice_id: str) -> dict:
         return {
             "id": invoice_id,
             "number": f"INV{invoice_id}",
@@ -74,20 +186,247 @@ class ERPClient:
     
     async def update_invoice(self, invoice_id: str, values: dict) -> bool:
         """Update an invoice."""
+        try:
+            return await self._write_invoice(invoice_id, values)
+        finally:
+            self.invalidate("account.move", invoice_id)
+    
+    async def _write_invoice(self, invoice_id: str, values: dict) -> bool:
         logger.info(f"Updating invoice {invoice_id} with {values}")
         return True
     
     async def create_entity(self, model: str, values: dict) -> str:
         """Create a new entity and return its ID."""
+        try:
+            return await self._create_entity(model, values)
+        finally:
+            self.invalidate(model)
+    
+    async def _create_entity(self, model: str, values: dict) -> str:
         logger.info(f"Creating {model} with {values}")
         return "NEW123"
     
     async def search_entities(self, model: str, domain: list) -> list[dict]:
         """Search for entities matching criteria."""
+        return await self._cached(
+            ("search", model, repr(domain)),
+            lambda: self._search_entities(model, domain),
+        )
+    
+    async def _search_entities(self, model: str, domain: list) -> list[dict]:
         return []
+    
+    async def bulk_write(self, model: str, writes: list[tuple[str, dict]]) -> bool:
+        """Apply several (entity_id, values) writes to one model."""
+        try:
+            return await self._bulk_write(model, writes)
+        finally:
+            for entity_id, _ in writes:
+                self.invalidate(model, entity_id)
+    
+    async def _bulk_write(self, model: str, writes: list[tuple[str, dict]]) -> bool:
+        # By default, apply the writes one record at a time, in order, through
+        # the per-record write methods. Override this if your ERP has a bulk API.
+        # Example for Odoo, one call per group of records sharing the same values:
+        # self.odoo_client.execute_kw(model, 'write', [ids, values])
+        if model == "sale.order":
+            write = self._write_sale_order
+        elif model == "account.move":
+            write = self._write_invoice
+        else:
+            raise ValueError(f"No per-record write for model {model}")
+        
+        results = [await write(entity_id, values) for entity_id, values in writes]
+        return all(results)
+
+
+class ERPClientClosedError(Exception):
+    """Raised for writes that were pending when a BatchingERPClient closed."""
+
+
+class BatchingERPClient:
+    """
+    Wraps an ERPClient so that concurrent updates share bulk writes.
+    
+    Calls to update_sale_order and update_invoice are queued, and a background
+    task sends them to the wrapped client's bulk_write in batches of up to
+    batch_size, waiting at most max_delay seconds for a batch to fill. Each
+    caller still awaits the result of its own write. All other attributes are
+    forwarded to the wrapped client.
+    
+    The background task is started by the first write and then runs until
+    aclose() is called, or until its event loop shuts down (asyncio.run cancels
+    it then). Either way, writes that were still pending fail with
+    ERPClientClosedError rather than being left waiting.
+    """
+    
+    def __init__(self, client: ERPClient, batch_size: int = 16, max_delay: float = 0.005):
+        self._client = client
+        self.batch_size = batch_size
+        self.max_delay = max_delay
+        self._queue: asyncio.Queue | None = None
+        self._worker: asyncio.Task | None = None
+    
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._client, name)
+    
+    async def update_sale_order(self, order_id: str, values: dict) -> bool:
+        """Queue an update to a sale order."""
+        return await self._submit("sale.order", order_id, values)
+    
+    async def update_invoice(self, invoice_id: str, values: dict) -> bool:
+        """Queue an update to an invoice."""
+        return await self._submit("account.move", invoice_id, values)
+    
+    async def aclose(self) -> None:
+        """Stop the background batching task, then close the wrapped client."""
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+        await self._client.aclose()
+    
+    async def _submit(self, model: str, entity_id: str, values: dict) -> bool:
+        loop = asyncio.get_running_loop()
+        # (Re)start the batcher on first use, or if it was left behind on
+        # another event loop
+        if self._worker is None or self._worker.done() or self._worker.get_loop() is not loop:
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._run(self._queue))
+        
+        future = loop.create_future()
+        self._queue.put_nowait((model, entity_id, values, future))
+        return await future
+    
+    async def _run(self, queue: asyncio.Queue) -> None:
+        loop = asyncio.get_running_loop()
+        batch = []
+        try:
+            while True:
+                batch = [await queue.get()]
+                deadline = loop.time() + self.max_delay
+                while len(batch) < self.batch_size:
+                    if not queue.empty():
+                        batch.append(queue.get_nowait())
+                        continue
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(queue.get(), remaining))
+                    except asyncio.TimeoutError:
+                        break
+                await self._flush(batch)
+                batch = []
+        except asyncio.CancelledError:
+            # Fail the batch in flight (futures already resolved are skipped)
+            # and everything still queued, so that no caller waits forever
+            while not queue.empty():
+                batch.append(queue.get_nowait())
+            for *_, future in batch:
+                if not future.done():
+                    future.set_exception(
+                        ERPClientClosedError("ERP client closed before the write completed")
+                    )
+            raise
+    
+    async def _flush(self, batch: list[tuple[str, str, dict, asyncio.Future]]) -> None:
+        by_model: dict[str, list[tuple[str, str, dict, asyncio.Future]]] = {}
+        for item in batch:
+            by_model.setdefault(item[0], []).append(item)
+        
+        for model, items in by_model.items():
+            try:
+                result = await self._client.bulk_write(
+                    model, [(entity_id, values) for _, entity_id, values, _ in items]
+                )
+            except Exception as e:
+                for *_, future in items:
+                    if not future.done():
+                        future.set_exception(e)
+            else:
+                for *_, future in items:
+                    if not future.done():
+                        future.set_result(result)
+
+
+# problem_id -> (relative path, contents) of supporting files for the agent
+_SUPPORTING_FILES: dict[str, tuple[tuple[str, bytes], ...]] = {
+    # Mock approval document
+    "update_credit_003": (
+        ("approvals/credit_approval_003.pdf", b"APPROVED: Credit limit increase to 50000.00"),
+    ),
+    # Requirements file
+    "create_order_004": (
+        (
+            "requirements.txt",
+            b"Product A - Quantity: 10 - Price: 100.00\n"
+            b"Product B - Quantity: 5 - Price: 250.00",
+        ),
+    ),
+}
+
+
+def _write_file(path: str, data: bytes) -> None:
+    # 0o666 is open()'s default mode, so permissions still follow the umask
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
 
+def _write_setup_files(
+    problem_dir: Path,
+    erp_config_json: bytes,
+    readme: bytes,
+    extra_files: Iterable[tuple[str, bytes]],
+) -> None:
+    """Write a problem's setup files, which are already encoded, in one pass."""
+    _write_file(os.path.join(problem_dir, "erp_config.json"), erp_config_json)
+    for relative_path, data in extra_files:
+        path = os.path.join(problem_dir, relative_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        _write_file(path, data)
+    _write_file(os.path.join(problem_dir, "README.md"), readme)
 
-@dataclass
+
+# (entity) -> (score, error)
+Verifier = Callable[[dict], tuple[float, str | None]]
+
+
+def _compile_verifier(expected_changes: dict) -> Verifier:
+    """
+    Generate a straight-line function checking an entity against expected_changes.
+    
+    The score is the fraction of expected fields with the expected value, and
+    the error lists the mismatches. Field names and error message prefixes are
+    baked into the generated source; expected values are bound as globals.
+    """
+    namespace: dict[str, Any] = {}
+    lines = ["def _verify(entity):", "    errors = []", "    correct = 0"]
+    for i, (field, expected) in enumerate(expected_changes.items()):
+        namespace[f"_expected_{i}"] = expected
+        lines += [
+            f"    actual = entity.get({field!r})",
+            f"    if actual == _expected_{i}:",
+            "        correct += 1",
+            "    else:",
+            f"        errors.append({f'{field}: expected {expected}, got '!r} + format(actual))",
+        ]
+    lines.append(
+        f"    return correct / {len(expected_changes)}, '; '.join(errors) if errors else None"
+    )
+    exec("\n".join(lines), namespace)
+    return namespace["_verify"]
+
+
+@dataclass(slots=True, frozen=True)
 class ERPProblem(Problem):
     """Extended Problem class for ERP tasks."""
     
@@ -98,6 +437,118 @@ class ERPProblem(Problem):
     verification_query: str = None  # Custom verification logic
 
 
+# ERP-specific test problems
+_STATIC_ERP_PROBLEMS: tuple[ERPProblem, ...] = (
+    # Problem 1: Update sale order discount
+    ERPProblem(
+        problem_id="update_discount_001",
+        statement="""
+Access the ERP system using the credentials in erp_config.json.
+Find the sale order SO001 and apply a 10% discount to all line items.
+The order should remain in 'draft' state.
+Submit 'DONE' when complete.
+        """.strip(),
+        answer="DONE",
+        answer_discussion="Applied 10% discount to all line items",
+        entity_type="sale_order",
+        entity_id="SO001",
+        initial_state={"discount": 0.0, "state": "draft"},
+        expected_changes={"discount": 10.0, "state": "draft"}
+    ),
+    
+    # Problem 2: Confirm and validate invoice
+    ERPProblem(
+        problem_id="confirm_invoice_002",
+        statement="""
+Access the ERP system and locate invoice INV002.
+Validate the invoice totals match the related sale order.
+If correct, move the invoice to 'posted' state.
+Submit 'COMPLETED' when done.
+        """.strip(),
+        answer="COMPLETED",
+        answer_discussion="Invoice validated and posted",
+        entity_type="invoice",
+        entity_id="INV002",
+        initial_state={"state": "draft"},
+        expected_changes={"state": "posted"}
+    ),
+    
+    # Problem 3: Update customer credit limit
+    ERPProblem(
+        problem_id="update_credit_003",
+        statement="""
+Find customer with ID CUST003 in the ERP system.
+Update their credit limit to 50000.00 based on the approval 
+document in approvals/credit_approval_003.pdf.
+Submit 'UPDATED' when complete.
+        """.strip(),
+        answer="UPDATED",
+        answer_discussion="Credit limit updated based on approval",
+        entity_type="customer",
+        entity_id="CUST003",
+        expected_changes={"credit_limit": 50000.00}
+    ),
+    
+    # Problem 4: Create new sale order
+    ERPProblem(
+        problem_id="create_order_004",
+        statement="""
+Create a new sale order for customer CUST001 with the items 
+listed in requirements.txt. Use current date and standard pricing.
+Submit the new order ID when complete.
+        """.strip(),
+        answer="SO_NEW",  # Will be dynamic
+        answer_discussion="New sale order created successfully",
+        entity_type="sale_order",
+        entity_id=None,  # Will be created
+        expected_changes={"state": "draft", "partner_id": "CUST001"}
+    ),
+    
+    # Problem 5: Batch update delivery dates
+    ERPProblem(
+        problem_id="batch_update_005",
+        statement="""
+Query all sale orders in 'confirmed' state with delivery date before 2026-02-01.
+Update their delivery dates to 2026-03-15 due to supplier delays.
+Submit the count of updated orders.
+        """.strip(),
+        answer="5",  # Expected number of updated orders
+        answer_discussion="Updated delivery dates for delayed orders",
+        entity_type="sale_order",
+        verification_query="count_updated_orders"
+    ),
+)
+
+def _encode_readme(problem: ERPProblem) -> bytes:
+    """Encode the README with instructions given to the agent."""
+    return f"""
+# ERP Task: {problem.problem_id}
+
+## Configuration
+- ERP config: `erp_config.json`
+- Connection details and API credentials are provided
+
+## Task
+{problem.statement}
+
+## Submission
+Submit your answer to answer.txt when complete.
+    """.strip().encode()
+
+
+# problem_id -> README.md contents
+_STATIC_ERP_READMES: dict[str, bytes] = {
+    p.problem_id: _encode_readme(p) for p in _STATIC_ERP_PROBLEMS
+}
+
+# problem_id -> verifier compiled from the problem's expected changes
+_STATIC_ERP_VERIFIERS: dict[str, Verifier] = {
+    p.problem_id: _compile_verifier(p.expected_changes)
+    for p in _STATIC_ERP_PROBLEMS
+    if p.expected_changes
+}
+
+
 class ERPWorkflowBenchmark(BaseBenchmark):
     """
     Benchmark for ERP system interaction workflows.
@@ -125,99 +576,64 @@ class ERPWorkflowBenchmark(BaseBenchmark):
     ):
         super().__init__(seed, subset_size)
         
-        # Initialize ERP connection
-        self.erp_client = ERPClient(erp_url, api_key or "test_key", database)
+        # Initialize ERP connection. Problems are set up concurrently by the
+        # runner's workers, so their state resets are batched into bulk writes.
+        self.erp_client = BatchingERPClient(
+            ERPClient(erp_url, api_key or "test_key", database)
+        )
         
         # Load or generate test problems
-        self._problems = self._create_problems()
-    
-    def _create_problems(self) -> list[ERPProblem]:
-        """Create ERP-specific test problems."""
-        return [
-            # Problem 1: Update sale order discount
-            ERPProblem(
-                problem_id="update_discount_001",
-                statement="""
-Access the ERP system using the credentials in erp_config.json.
-Find the sale order SO001 and apply a 10% discount to all line items.
-The order should remain in 'draft' state.
-Submit 'DONE' when complete.
-                """.strip(),
-                answer="DONE",
-                answer_discussion="Applied 10% discount to all line items",
-                entity_type="sale_order",
-                entity_id="SO001",
-                initial_state={"discount": 0.0, "state": "draft"},
-                expected_changes={"discount": 10.0, "state": "draft"}
-            ),
-            
-            # Problem 2: Confirm and validate invoice
-            ERPProblem(
-                problem_id="confirm_invoice_002",
-                statement="""
-Access the ERP system and locate invoice INV002.
-Validate the invoice totals match the related sale order.
-If correct, move the invoice to 'posted' state.
-Submit 'COMPLETED' when done.
-                """.strip(),
-                answer="COMPLETED",
-                answer_discussion="Invoice validated and posted",
-                entity_type="invoice",
-                entity_id="INV002",
-                initial_state={"state": "draft"},
-                expected_changes={"state": "posted"}
-            ),
-            
-            # Problem 3: Update customer credit limit
-            ERPProblem(
-                problem_id="update_credit_003",
-                statement="""
-Find customer with ID CUST003 in the ERP system.
-Update their credit limit to 50000.00 based on the approval 
-document in approvals/credit_approval_003.pdf.
-Submit 'UPDATED' when complete.
-                """.strip(),
-                answer="UPDATED",
-                answer_discussion="Credit limit updated based on approval",
-                entity_type="customer",
-                entity_id="CUST003",
-                expected_changes={"credit_limit": 50000.00}
-            ),
-            
-            # Problem 4: Create new sale order
-            ERPProblem(
-                problem_id="create_order_004",
-                statement="""
-Create a new sale order for customer CUST001 with the items 
-listed in requirements.txt. Use current date and standard pricing.
-Submit the new order ID when complete.
-                """.strip(),
-                answer="SO_NEW",  # Will be dynamic
-                answer_discussion="New sale order created successfully",
-                entity_type="sale_order",
-                entity_id=None,  # Will be created
-                expected_changes={"state": "draft", "partner_id": "CUST001"}
-            ),
-            
-            # Problem 5: Batch update delivery dates
-            ERPProblem(
-                problem_id="batch_update_005",
-                statement="""
-Query all sale orders in 'confirmed' state with delivery date before 2026-02-01.
-Update their delivery dates to 2026-03-15 due to supplier delays.
-Submit the count of updated orders.
-                """.strip(),
-                answer="5",  # Expected number of updated orders
-                answer_discussion="Updated delivery dates for delayed orders",
-                entity_type="sale_order",
-                verification_query="count_updated_orders"
-            ),
-        ]
+        self._problems = _STATIC_ERP_PROBLEMS
+        self._problem_map = {p.problem_id: p for p in self._problems}
+        self._verifiers = _STATIC_ERP_VERIFIERS
+        
+        # problem_id -> encoded erp_config.json, for the current erp_client
+        self._erp_configs = {p.problem_id: self._encode_erp_config(p) for p in self._problems}
     
     @property
-    def problems(self) -> list[Problem]:
+    def erp_client(self) -> ERPClient | BatchingERPClient:
+        """The client used to set up and verify problems in the ERP system."""
+        return self._erp_client
+    
+    @erp_client.setter
+    def erp_client(self, client: ERPClient | BatchingERPClient) -> None:
+        self._erp_client = client
+        # The encoded configs hold the client's settings, so re-encode them
+        # for a replacement client (they're built in __init__ the first time)
+        if hasattr(self, "_erp_configs"):
+            self._erp_configs = {
+                p.problem_id: self._encode_erp_config(p) for p in self._problems
+            }
+    
+    def _is_static(self, problem: ERPProblem) -> bool:
+        """Whether problem is one of the static problems, rather than derived from one.
+        
+        Only static problems can use the configs, READMEs and verifiers that
+        are prepared for them by problem_id.
+        """
+        return self._problem_map.get(problem.problem_id) is problem
+    
+    def _encode_erp_config(self, problem: ERPProblem) -> bytes:
+        """Encode the ERP connection configuration given to the agent."""
+        erp_config = {
+            "url": self.erp_client.base_url,
+            "api_key": self.erp_client.api_key,
+            "database": self.erp_client.database,
+            "entity_type": problem.entity_type,
+            "entity_id": problem.entity_id,
+            # Include any SDK/library hints
+            "suggested_libraries": ["requests", "odoo-rpc", "your-erp-sdk"],
+            "documentation_url": "http://docs.your-erp.com/api"
+        }
+        return fast_json.dumps(erp_config, indent=True)
+    
+    @property
+    def problems(self) -> Sequence[Problem]:
         return self._problems
     
+    def get_problem(self, problem_id: str) -> Problem | None:
+        return self._problem_map.get(problem_id)
+    
     async def setup_problem(
         self,
         problem: ERPProblem,
@@ -231,22 +647,29 @@ Submit the count of updated orders.
         3. Create any supporting files
         """
         
-        # 1. Create ERP connection configuration for the agent
-        erp_config = {
-            "url": self.erp_client.base_url,
-            "api_key": self.erp_client.api_key,
-            "database": self.erp_client.database,
-            "entity_type": problem.entity_type,
-            "entity_id": problem.entity_id,
-            # Include any SDK/library hints
-            "suggested_libraries": ["requests", "odoo-rpc", "your-erp-sdk"],
-            "documentation_url": "http://docs.your-erp.com/api"
-        }
+        # 1. ERP connection configuration and 4. README, encoded up front for
+        # the static problems
+        if self._is_static(problem):
+            erp_config_json = self._erp_configs[problem.problem_id]
+            readme = _STATIC_ERP_READMES[problem.problem_id]
+        else:
+            erp_config_json = self._encode_erp_config(problem)
+            readme = _encode_readme(problem)
         
-        config_file = problem_data_dir / "erp_config.json"
-        config_file.write_text(json.dumps(erp_config, indent=2))
+        # 3. Create supporting files if needed
+        extra_files = _SUPPORTING_FILES.get(problem.problem_id, ())
         
-        # 2. Set up initial state in the ERP system
+        # Write all the files in one worker thread hop, while (2) the initial
+        # entity state is set up in the ERP system
+        await asyncio.gather(
+            asyncio.to_thread(
+                _write_setup_files, problem_data_dir, erp_config_json, readme, extra_files
+            ),
+            self._reset_entity_state(problem),
+        )
+    
+    async def _reset_entity_state(self, problem: ERPProblem) -> None:
+        """Set up the initial state of the problem's entity in the ERP system."""
         if problem.entity_id and problem.initial_state:
             try:
                 # Reset entity to known initial state
@@ -264,38 +687,6 @@ Submit the count of updated orders.
                 
             except Exception as e:
                 logger.error(f"Failed to set up entity state: {e}")
-        
-        # 3. Create supporting files if needed
-        if problem.problem_id == "update_credit_003":
-            # Create mock approval document
-            approvals_dir = problem_data_dir / "approvals"
-            approvals_dir.mkdir(exist_ok=True)
-            approval_doc = approvals_dir / "credit_approval_003.pdf"
-            approval_doc.write_text("APPROVED: Credit limit increase to 50000.00")
-        
-        elif problem.problem_id == "create_order_004":
-            # Create requirements file
-            requirements_file = problem_data_dir / "requirements.txt"
-            requirements_file.write_text("""
-Product A - Quantity: 10 - Price: 100.00
-Product B - Quantity: 5 - Price: 250.00
-            """.strip())
-        
-        # 4. Create a README with instructions (optional but helpful)
-        readme = problem_data_dir / "README.md"
-        readme.write_text(f"""
-# ERP Task: {problem.problem_id}
-
-## Configuration
-- ERP config: `erp_config.json`
-- Connection details and API credentials are provided
-
-## Task
-{problem.statement}
-
-## Submission
-Submit your answer to answer.txt when complete.
-        """.strip())
     
     async def score_problem(
         self,
@@ -314,21 +705,32 @@ Submit your answer to answer.txt when complete.
         """
         
         try:
-            # Read the agent's submitted answer
-            answer_path = Path(agent_answer_dir) / "answer.txt"
-            if not answer_path.exists():
+            # Read the agent's submitted answer while the entity it should have
+            # modified is fetched from the ERP system
+            submitted_answer, entity = await asyncio.gather(
+                asyncio.to_thread(read_answer, agent_answer_dir),
+                self._fetch_entity(problem),
+                return_exceptions=True,
+            )
+            if isinstance(submitted_answer, FileNotFoundError):
                 return 0.0, "No answer.txt file submitted", None
-            
-            submitted_answer = answer_path.read_text().strip()
+            if isinstance(submitted_answer, BaseException):
+                raise submitted_answer
+            if isinstance(entity, Exception):
+                # Leave it to the verifier to fetch the entity again, and to
+                # report the error in context if that fails too
+                entity = None
+            elif isinstance(entity, BaseException):
+                raise entity
             
             # Verify actual changes in the ERP system
             if problem.entity_type == "sale_order":
                 score, error = await self._verify_sale_order_changes(
-                    problem, submitted_answer
+                    problem, submitted_answer, entity
                 )
             elif problem.entity_type == "invoice":
                 score, error = await self._verify_invoice_changes(
-                    problem, submitted_answer
+                    problem, submitted_answer, entity
                 )
             elif problem.entity_type == "customer":
                 score, error = await self._verify_customer_changes(
@@ -349,12 +751,29 @@ Submit your answer to answer.txt when complete.
             logger.error(f"Error scoring ERP problem: {e}")
             return 0.0, str(e), None
     
+    async def _fetch_entity(self, problem: ERPProblem) -> dict | None:
+        """Fetch the existing entity a problem modifies, if it has one."""
+        if not problem.entity_id:
+            return None
+        if problem.entity_type == "sale_order":
+            return await self.erp_client.get_sale_order(problem.entity_id)
+        elif problem.entity_type == "invoice":
+            return await self.erp_client.get_invoice(problem.entity_id)
+        return None
+    
+    def _get_verifier(self, problem: ERPProblem) -> Verifier:
+        """Return the compiled verifier for a problem with expected changes."""
+        if self._is_static(problem):
+            return self._verifiers[problem.problem_id]
+        return _compile_verifier(problem.expected_changes)
+    
     async def _verify_sale_order_changes(
         self, 
         problem: ERPProblem, 
-        submitted_answer: str
+        submitted_answer: str,
+        order: dict | None = None
     ) -> tuple[float, str | None]:
-        """Verify changes to a sale order."""
+        """Verify changes to a sale order, fetching it unless it's given."""
         
         if not problem.entity_id:
             # New order creation case
@@ -367,11 +786,7 @@ Submit your answer to answer.txt when complete.
                 # Verify expected properties
                 score = 0.0
                 if problem.expected_changes:
-                    matches = sum(
-                        1 for key, expected_value in problem.expected_changes.items()
-                        if order.get(key) == expected_value
-                    )
-                    score = matches / len(problem.expected_changes)
+                    score, _ = self._get_verifier(problem)(order)
                 else:
                     score = 1.0
                 
@@ -383,26 +798,12 @@ Submit your answer to answer.txt when complete.
         else:
             # Update existing order case
             try:
-                order = await self.erp_client.get_sale_order(problem.entity_id)
+                if order is None:
+                    order = await self.erp_client.get_sale_order(problem.entity_id)
                 
                 # Check each expected change
                 if problem.expected_changes:
-                    correct_changes = 0
-                    total_changes = len(problem.expected_changes)
-                    errors = []
-                    
-                    for field, expected_value in problem.expected_changes.items():
-                        actual_value = order.get(field)
-                        if actual_value == expected_value:
-                            correct_changes += 1
-                        else:
-                            errors.append(
-                                f"{field}: expected {expected_value}, got {actual_value}"
-                            )
-                    
-                    score = correct_changes / total_changes
-                    error = "; ".join(errors) if errors else None
-                    return score, error
+                    return self._get_verifier(problem)(order)
                 
                 # No specific changes to verify, just check answer matches
                 if submitted_answer.upper() == problem.answer.upper():
@@ -416,24 +817,16 @@ Submit your answer to answer.txt when complete.
     async def _verify_invoice_changes(
         self,
         problem: ERPProblem,
-        submitted_answer: str
+        submitted_answer: str,
+        invoice: dict | None = None
     ) -> tuple[float, str | None]:
-        """Verify changes to an invoice."""
+        """Verify changes to an invoice, fetching it unless it's given."""
         try:
-            invoice = await self.erp_client.get_invoice(problem.entity_id)
+            if invoice is None:
+                invoice = await self.erp_client.get_invoice(problem.entity_id)
             
             if problem.expected_changes:
-                score = 0.0
-                errors = []
-                
-                for field, expected in problem.expected_changes.items():
-                    actual = invoice.get(field)
-                    if actual == expected:
-                        score += 1.0 / len(problem.expected_changes)
-                    else:
-                        errors.append(f"{field}: expected {expected}, got {actual}")
-                
-                return score, "; ".join(errors) if errors else None
+                return self._get_verifier(problem)(invoice)
             
             return 1.0 if submitted_answer == problem.answer else 0.0, None
             
@@ -501,6 +894,20 @@ Submit your answer to answer.txt when complete.
                 # Add other cleanup as needed
             except Exception as e:
                 logger.warning(f"Cleanup failed: {e}")
+    
+    async def aclose(self) -> None:
+        """Close the ERP client, stopping its background write batching."""
+        await self.erp_client.aclose()
+
+
+_DATABASE_PROBLEMS: tuple[Problem, ...] = (
+    Problem(
+        problem_id="db_update_001",
+        statement="Update sale order SO001 discount to 15%",
+        answer="DONE",
+        answer_discussion="Direct database verification"
+    ),
+)
 
 
 # Alternative: Database-based ERP verification
@@ -516,27 +923,23 @@ class ERPDatabaseBenchmark(BaseBenchmark):
         super().__init__(**kwargs)
         self.db_conn = db_connection_string
         # Initialize database connection (SQLAlchemy, psycopg2, etc.)
-    
-    @property
-    def problems(self) -> list[Problem]:
-        return [
-            Problem(
-                problem_id="db_update_001",
-                statement="Update sale order SO001 discount to 15%",
-                answer="DONE",
-                answer_discussion="Direct database verification"
-            )
-        ]
-    
-    async def setup_problem(self, problem, problem_data_dir, container_name):
-        """Provide database connection info to agent."""
+        
+        # The connection info given to the agent is the same for every problem
         db_config = {
             "connection_string": self.db_conn,
             "readonly": False,  # Or True if you want agent to use API
             "schema": "public",
             "table": "sale_orders"
         }
-        (problem_data_dir / "db_config.json").write_text(json.dumps(db_config))
+        self._db_config_json = fast_json.dumps(db_config)
+    
+    @property
+    def problems(self) -> Sequence[Problem]:
+        return _DATABASE_PROBLEMS
+    
+    async def setup_problem(self, problem, problem_data_dir, container_name):
+        """Provide database connection info to agent."""
+        (problem_data_dir / "db_config.json").write_bytes(self._db_config_json)
     
     async def score_problem(self, problem, agent_workdir, agent_answer_dir, container_name):
         """Query database directly to verify changes."""
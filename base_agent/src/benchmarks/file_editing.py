@@ -42,7 +42,7 @@ REPO_LIST: Set[str] = {
     "sympy/sympy",
 }
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FileEditProblem(Problem):
     """Problem subclass specifically for file editing tasks"""
 
@@ -18,7 +18,7 @@ are presented with randomized answer choices, and responses must be in the forma
 import os
 import random
 from pathlib import Path
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from typing import Any, ClassVar, List, Tuple
 from dotenv import load_dotenv
 from datasets import load_dataset
@@ -244,8 +244,7 @@ if __name__ == "__main__":
         """Helper function to run a single test case"""
         print(f"\nTESTING: '{ground_truth}' vs '{agent_answer}' (should_pass={should_pass})")
 
-        problem = benchmark.problems[0]  # Use first problem as template
-        problem.answer = ground_truth
+        problem = replace(benchmark.problems[0], answer=ground_truth)  # Use first problem as template
 
         answer_file = answer_dir / "answer.txt"
         answer_file.write_text(agent_answer)
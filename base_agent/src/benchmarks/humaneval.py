@@ -10,14 +10,20 @@ import logging
 from typing import Literal
 from pathlib import Path
 from datasets import load_dataset
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 
 from .base import BaseBenchmark, Problem
 
 logger = logging.getLogger(__name__)
 
+FILE_MODE_STATEMENT = (
+    "Complete the function implementation in 'problem.py'. "
+    "The file contains the function signature and docstring. "
+    "Your implementation must pass all tests in 'tests.py'."
+)
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class HumanEvalProblem(Problem):
     """Problem subclass specifically for HumanEval tasks"""
 
@@ -65,6 +71,13 @@ class HumanEvalBenchmark(BaseBenchmark):
             self._all_problems = [
                 HumanEvalProblem.from_raw(ex) for ex in dataset["test"]
             ]
+            if mode == "file":
+                # The agent works from the problem.py and tests.py files
+                # created in setup_problem
+                self._all_problems = [
+                    replace(p, statement=FILE_MODE_STATEMENT)
+                    for p in self._all_problems
+                ]
         except Exception as e:
             logger.error(f"Error loading HumanEval dataset: {e}")
             self._all_problems = [
@@ -132,14 +145,6 @@ if __name__ == "__main__":
 """
             test_file.write_text(test_content)
 
-            # Modify the problem statement for file mode
-            file_mode_statement = (
-                f"Complete the function implementation in 'problem.py'. "
-                f"The file contains the function signature and docstring. "
-                f"Your implementation must pass all tests in 'tests.py'."
-            )
-            setattr(problem, "statement", file_mode_statement)
-
     async def score_problem(
         self,
         problem: Problem,
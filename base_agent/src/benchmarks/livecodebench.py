@@ -200,7 +200,7 @@ class Test:
             return None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LiveCodeBenchProblem(Problem):
     """Problem subclass specifically for LiveCodeBench tasks."""
 
@@ -9,7 +9,7 @@ import random
 
 from pathlib import Path
 from datasets import load_dataset
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from typing import List, Tuple, Optional
 
 from .base import BaseBenchmark, Problem
@@ -472,9 +472,11 @@ if __name__ == "__main__":
         """Helper function to run a single test case"""
         print(f"\nTESTING: '{ground_truth}' vs '{agent_answer}' (should_pass={should_pass})")
 
-        problem = benchmark.problems[0]  # Use first problem as template
-        problem.answer = ground_truth
-        problem.answer_discussion = "Test discussion"
+        problem = replace(  # Use first problem as template
+            benchmark.problems[0],
+            answer=ground_truth,
+            answer_discussion="Test discussion",
+        )
 
         answer_file = answer_dir / "answer.txt"
         answer_file.write_text(agent_answer)
@@ -79,7 +79,7 @@ class SymbolLocation:
         assert isinstance(self.context, str) and self.context, "Context must be non-empty string"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SymbolLocationProblem(Problem):
     """Problem subclass for finding symbol definitions"""
     repo_name: str
@@ -0,0 +1,76 @@
+# Self-Improving Coding Agent
+# Copyright (c) 2025 Maxime Robeyns
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+"""
+JSON encoding and decoding on bytes.
+
+Uses orjson when it is installed, and falls back to the standard library json
+module otherwise. Decoding errors from either backend are instances of
+json.JSONDecodeError.
+"""
+
+import json
+
+from typing import Any, Iterable, Iterator
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+JSONDecodeError = json.JSONDecodeError
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialise obj to UTF-8 encoded JSON, optionally with a 2-space indent."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+    return json.dumps(obj, indent=2 if indent else None).encode()
+
+
+def loads(data: bytes | str) -> Any:
+    """Deserialise a JSON document from bytes or str."""
+    if orjson is not None:
+        return orjson.loads(data)
+    try:
+        return json.loads(data)
+    except UnicodeDecodeError as e:
+        # orjson reports invalid UTF-8 as a decoding error, so do the same
+        raise JSONDecodeError(
+            f"Invalid UTF-8: {e.reason}", data.decode("utf-8", "replace"), e.start
+        ) from e
+
+
+def iter_jsonl(chunks: Iterable[bytes]) -> Iterator[Any]:
+    """Decode JSON Lines content supplied as a stream of byte chunks.
+
+    Chunks may split records at arbitrary points. Only the unterminated tail of
+    the input seen so far is carried between chunks, and each chunk is scanned
+    once, so decoding is linear in the total input size. Blank lines are
+    skipped.
+    """
+    pending: list[bytes] = []
+    for chunk in chunks:
+        end = chunk.find(b"\n")
+        if end == -1:
+            pending.append(chunk)
+            continue
+
+        pending.append(chunk[:end])
+        line = b"".join(pending)
+        if line.strip():
+            yield loads(line)
+
+        start = end + 1
+        while (end := chunk.find(b"\n", start)) != -1:
+            line = chunk[start:end]
+            if line.strip():
+                yield loads(line)
+            start = end + 1
+        pending = [chunk[start:]]
+
+    line = b"".join(pending)
+    if line.strip():
+        yield loads(line)
@@ -0,0 +1,19 @@
+# Self-Improving Coding Agent
+# Copyright (c) 2025 Maxime Robeyns
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+"""Shared fixtures for the benchmark tests."""
+import pytest
+
+from src.benchmarks.data_transform import DataTransformBenchmark
+
+
+@pytest.fixture(scope="session")
+def benchmark():
+    """A DataTransformBenchmark shared by all tests in the session.
+
+    The benchmark holds no per-problem state, so a single instance can be
+    reused rather than constructed for every test.
+    """
+    return DataTransformBenchmark()
@@ -5,12 +5,14 @@
 # LICENSE file in the root directory of this source tree.
 """Tests for the base benchmark components."""
 import os
+import random
 import pytest
 import tempfile
 import jsonlines
 import asyncio
 from pathlib import Path
 from datetime import datetime
+from dataclasses import FrozenInstanceError, replace
 from unittest.mock import Mock
 
 from src.benchmarks.base import BaseBenchmark, Problem, BenchmarkTracker
@@ -61,6 +63,22 @@ class TestProblems:
         assert problem.statement == "Test statement"
         assert problem.answer == "Test answer"
         assert problem.answer_discussion == "Test discussion"
+    
+    def test_problem_is_immutable(self):
+        """Test that Problems are frozen and a modified copy can be derived."""
+        problem = Problem(
+            problem_id="test_id",
+            statement="Test statement",
+            answer="Test answer",
+            answer_discussion=None
+        )
+        
+        with pytest.raises(FrozenInstanceError):
+            problem.answer = "Other answer"
+        
+        updated = replace(problem, answer="Other answer")
+        assert updated.answer == "Other answer"
+        assert problem.answer == "Test answer"
 
 
 class TestBenchmarkTracker:
@@ -228,3 +246,62 @@ class TestBaseBenchmark:
                 problem_data_dir=temp_path,
                 container_name="fake_container"
             )
+
+
+class TestSampleProblems:
+    """Tests for the stratified subset sampling in BaseBenchmark."""
+    
+    @staticmethod
+    def make_problems(categories):
+        return [
+            Problem(
+                problem_id=f"problem_{i}",
+                statement=f"Test problem {i}",
+                answer=f"Answer {i}",
+                answer_discussion=None,
+                category=category,
+            )
+            for i, category in enumerate(categories)
+        ]
+    
+    def test_no_subset_returns_all(self):
+        problems = self.make_problems(["a", "b", "c"])
+        assert SimpleBenchmark().sample_problems(problems) is problems
+        assert SimpleBenchmark(subset_size=3).sample_problems(problems) is problems
+    
+    def test_uncategorised_sample_is_seeded(self):
+        problems = self.make_problems([None] * 10)
+        first = SimpleBenchmark(seed=3, subset_size=4).sample_problems(problems)
+        second = SimpleBenchmark(seed=3, subset_size=4).sample_problems(problems)
+        
+        assert len(first) == 4
+        assert len({p.problem_id for p in first}) == 4
+        assert list(first) == list(second)
+    
+    def test_subset_is_a_view(self):
+        problems = self.make_problems([None] * 10)
+        subset = SimpleBenchmark(seed=3, subset_size=4).sample_problems(problems)
+        
+        assert all(any(p is q for q in problems) for p in subset)
+        assert subset[0] is next(iter(subset))
+        assert list(subset[1:3]) == list(subset)[1:3]
+        assert subset[-1] is list(subset)[-1]
+    
+    def test_sample_is_proportional_to_strata(self):
+        problems = self.make_problems(["easy"] * 6 + ["medium"] * 3 + ["hard"] * 1)
+        subset = SimpleBenchmark(seed=0, subset_size=5).sample_problems(problems)
+        
+        counts = {}
+        for problem in subset:
+            counts[problem.category] = counts.get(problem.category, 0) + 1
+        
+        # Exact quotas are 3, 1.5 and 0.5; the remainders are distributed first
+        # to the largest, with ties kept in stratum order
+        assert len(subset) == 5
+        assert counts == {"easy": 3, "medium": 2}
+    
+    def test_sampling_leaves_global_rng_untouched(self):
+        problems = self.make_problems(["a", "b"] * 5)
+        state = random.getstate()
+        SimpleBenchmark(seed=1, subset_size=3).sample_problems(problems)
+        assert random.getstate() == state
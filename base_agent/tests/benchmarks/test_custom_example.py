@@ -0,0 +1,209 @@
+# Self-Improving Coding Agent
+# Copyright (c) 2025 Maxime Robeyns
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+
+import pytest
+from dataclasses import replace
+
+from src.benchmarks.custom_example import (
+    CustomWorkflowBenchmark,
+    FileProcessingBenchmark,
+)
+from src.benchmarks.base import Problem
+from src.utils import fast_json
+
+
+def write_problems(data_dir, records):
+    """Write records to a problems.jsonl file in data_dir."""
+    content = b"".join(fast_json.dumps(record) + b"\n" for record in records)
+    (data_dir / "problems.jsonl").write_bytes(content)
+
+
+async def score(benchmark, problem_id, tmp_path, answer=None):
+    """Score a problem, optionally submitting answer to answer.txt first."""
+    if answer is not None:
+        (tmp_path / "answer.txt").write_text(answer)
+    return await benchmark.score_problem(
+        benchmark.get_problem(problem_id),
+        agent_workdir=str(tmp_path),
+        agent_answer_dir=str(tmp_path),
+        container_name="test"
+    )
+
+
+@pytest.fixture
+def sample_benchmark(tmp_path):
+    """A benchmark using the generated sample problems."""
+    return CustomWorkflowBenchmark(data_path=tmp_path / "missing")
+
+
+def test_generates_sample_problems_without_data(sample_benchmark):
+    """Test that sample problems are used when there is no data file."""
+    problem_ids = [p.problem_id for p in sample_benchmark.problems]
+    assert problem_ids == ["demo_1", "demo_2", "demo_3"]
+    assert sample_benchmark.get_problem("demo_2").answer == "Paris"
+    assert sample_benchmark.get_problem("nonexistent") is None
+
+
+def test_loads_problems_from_data_path(tmp_path):
+    """Test loading problems from problems.jsonl, with default ids."""
+    write_problems(tmp_path, [
+        {"id": "q1", "question": "Q1?", "expected_answer": "A1", "category": "easy"},
+        {"question": "Q2?", "expected_answer": 2, "explanation": "Because"},
+    ])
+    benchmark = CustomWorkflowBenchmark(data_path=tmp_path)
+
+    first, second = benchmark.problems
+    assert (first.problem_id, first.statement, first.answer) == ("q1", "Q1?", "A1")
+    assert first.category == "easy"
+    assert first.answer_discussion is None
+    assert (second.problem_id, second.answer) == ("1", 2)
+    assert second.category is None
+    assert second.answer_discussion == "Because"
+    assert benchmark.get_problem("1") is second
+
+
+def test_seeded_subset(tmp_path):
+    """Test that subsets are reproducible for a seed and indexed by ID."""
+    write_problems(tmp_path, [
+        {"id": f"q{i}", "question": f"Q{i}?", "expected_answer": str(i)}
+        for i in range(10)
+    ])
+    first = CustomWorkflowBenchmark(data_path=tmp_path, seed=7, subset_size=4)
+    second = CustomWorkflowBenchmark(data_path=tmp_path, seed=7, subset_size=4)
+
+    problem_ids = [p.problem_id for p in first.problems]
+    assert len(problem_ids) == 4
+    assert problem_ids == [p.problem_id for p in second.problems]
+    assert all(first.get_problem(problem_id) is not None for problem_id in problem_ids)
+    excluded = {f"q{i}" for i in range(10)} - set(problem_ids)
+    assert all(first.get_problem(problem_id) is None for problem_id in excluded)
+
+
+@pytest.mark.asyncio
+async def test_score_exact_match(sample_benchmark, tmp_path):
+    """Test exact-match scoring ignores case and surrounding whitespace."""
+    score_, error, _ = await score(sample_benchmark, "demo_2", tmp_path, "  paris\n")
+    assert (score_, error) == (1.0, None)
+
+    score_, _, _ = await score(sample_benchmark, "demo_2", tmp_path, "Lyon")
+    assert score_ == 0.0
+
+
+@pytest.mark.asyncio
+async def test_score_exact_match_casefolds(tmp_path):
+    """Test that exact matching is caseless in the Unicode sense."""
+    write_problems(tmp_path, [
+        {"id": "q1", "question": "Q1?", "expected_answer": "Straße"},
+    ])
+    benchmark = CustomWorkflowBenchmark(data_path=tmp_path)
+
+    # "ß".lower() is "ß", but it casefolds to "ss"
+    score_, error, _ = await score(benchmark, "q1", tmp_path, "STRASSE")
+    assert (score_, error) == (1.0, None)
+
+
+@pytest.mark.asyncio
+async def test_score_exact_match_unindexed_problem(sample_benchmark, tmp_path):
+    """Test exact matching for a problem whose answer wasn't folded up front."""
+    problem = Problem(
+        problem_id="unindexed",
+        statement="Spell the German word for street.",
+        answer="Straße",
+        answer_discussion=None
+    )
+    (tmp_path / "answer.txt").write_text("strasse")
+
+    score_, error, _ = await sample_benchmark.score_problem(
+        problem, str(tmp_path), str(tmp_path), "test"
+    )
+    assert (score_, error) == (1.0, None)
+
+
+@pytest.mark.asyncio
+async def test_score_replaced_problem(sample_benchmark, tmp_path):
+    """Test that a problem derived with replace() is scored on its own answer."""
+    problem = replace(sample_benchmark.get_problem("demo_2"), answer="Berlin")
+    (tmp_path / "answer.txt").write_text("Berlin")
+
+    score_, error, _ = await sample_benchmark.score_problem(
+        problem, str(tmp_path), str(tmp_path), "test"
+    )
+    assert (score_, error) == (1.0, None)
+
+    # A numeric answer switches the scorer too
+    problem = replace(problem, answer=7)
+    (tmp_path / "answer.txt").write_text("7")
+    score_, error, _ = await sample_benchmark.score_problem(
+        problem, str(tmp_path), str(tmp_path), "test"
+    )
+    assert (score_, error) == (1.0, None)
+
+
+@pytest.mark.asyncio
+async def test_score_numeric(sample_benchmark, tmp_path):
+    """Test numeric scoring with thousands separators and bad input."""
+    score_, error, _ = await score(sample_benchmark, "demo_1", tmp_path, "1,00.0")
+    assert (score_, error) == (1.0, None)
+
+    score_, error, _ = await score(sample_benchmark, "demo_1", tmp_path, "99")
+    assert score_ == 0.0
+    assert error == "Expected 100, got 99.0"
+
+    score_, error, _ = await score(sample_benchmark, "demo_1", tmp_path, "a hundred")
+    assert score_ == 0.0
+    assert "Could not parse numeric answer" in error
+
+
+@pytest.mark.asyncio
+async def test_score_missing_answer(sample_benchmark, tmp_path):
+    """Test scoring when answer.txt is missing."""
+    score_, error, _ = await score(sample_benchmark, "demo_1", tmp_path)
+    assert (score_, error) == (0.0, "No answer.txt file found")
+
+
+@pytest.mark.asyncio
+async def test_score_unexpected_format(tmp_path):
+    """Test that answers which are neither text nor numbers can't be scored."""
+    write_problems(tmp_path, [
+        {"id": "q1", "question": "Q1?", "expected_answer": ["a", "b"]},
+    ])
+    benchmark = CustomWorkflowBenchmark(data_path=tmp_path)
+
+    score_, error, _ = await score(benchmark, "q1", tmp_path, "a, b")
+    assert (score_, error) == (0.0, "Unexpected answer format")
+
+
+@pytest.mark.asyncio
+async def test_score_solution_file(tmp_path):
+    """Test the solution.py check for demo_3 when its answer isn't text."""
+    write_problems(tmp_path, [
+        {"id": "demo_3", "question": "Write add_numbers", "expected_answer": None},
+    ])
+    benchmark = CustomWorkflowBenchmark(data_path=tmp_path)
+
+    score_, error, _ = await score(benchmark, "demo_3", tmp_path, "DONE")
+    assert (score_, error) == (0.0, "solution.py not found")
+
+    (tmp_path / "solution.py").write_text("def add_numbers(a, b):\n    return a + b\n")
+    score_, error, _ = await score(benchmark, "demo_3", tmp_path, "DONE")
+    assert (score_, error) == (1.0, None)
+
+
+@pytest.mark.asyncio
+async def test_file_processing(tmp_path):
+    """Test FileProcessingBenchmark setup and output scoring."""
+    benchmark = FileProcessingBenchmark()
+    problem = benchmark.get_problem("csv_processing")
+
+    await benchmark.setup_problem(problem, tmp_path, "test")
+    assert (tmp_path / "data.csv").read_text().startswith("name,value")
+
+    score_, error, _ = await score(benchmark, "csv_processing", tmp_path)
+    assert (score_, error) == (0.0, "output.txt not found")
+
+    (tmp_path / "output.txt").write_text("42.5\n")
+    score_, error, _ = await score(benchmark, "csv_processing", tmp_path)
+    assert (score_, error) == (1.0, None)
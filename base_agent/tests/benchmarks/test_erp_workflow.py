@@ -0,0 +1,442 @@
+# Self-Improving Coding Agent
+# Copyright (c) 2025 Maxime Robeyns
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+
+import os
+import asyncio
+import pytest
+from dataclasses import replace
+
+from src.benchmarks.erp_workflow_example import (
+    BatchingERPClient,
+    ERPClient,
+    ERPClientClosedError,
+    ERPWorkflowBenchmark,
+    _compile_verifier,
+    _write_file,
+)
+from src.utils import fast_json
+
+
+class RecordingERPClient(ERPClient):
+    """Mock ERP client that records the bulk writes it receives."""
+
+    def __init__(self):
+        super().__init__("http://erp.test", "test_key", "test_db")
+        self.bulk_writes = []
+
+    async def bulk_write(self, model, writes):
+        self.bulk_writes.append((model, list(writes)))
+        return True
+
+
+@pytest.mark.asyncio
+async def test_batching_client_coalesces_concurrent_updates():
+    """Test that concurrent updates are sent as one bulk write per model."""
+    inner = RecordingERPClient()
+    client = BatchingERPClient(inner, batch_size=16, max_delay=0.05)
+
+    results = await asyncio.gather(
+        client.update_sale_order("SO001", {"discount": 0.0}),
+        client.update_sale_order("SO002", {"discount": 5.0}),
+        client.update_invoice("INV002", {"state": "draft"}),
+    )
+    await client.aclose()
+
+    assert results == [True, True, True]
+    assert sorted(inner.bulk_writes) == [
+        ("account.move", [("INV002", {"state": "draft"})]),
+        ("sale.order", [("SO001", {"discount": 0.0}), ("SO002", {"discount": 5.0})]),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_batching_client_respects_batch_size():
+    """Test that batches are split once they reach batch_size."""
+    inner = RecordingERPClient()
+    client = BatchingERPClient(inner, batch_size=2, max_delay=0.05)
+
+    await asyncio.gather(*(
+        client.update_sale_order(f"SO00{i}", {"state": "draft"}) for i in range(5)
+    ))
+    await client.aclose()
+
+    assert [len(writes) for _, writes in inner.bulk_writes] == [2, 2, 1]
+
+
+@pytest.mark.asyncio
+async def test_batching_client_propagates_errors():
+    """Test that a failed bulk write fails every update in the batch."""
+    class FailingERPClient(RecordingERPClient):
+        async def bulk_write(self, model, writes):
+            raise ConnectionError("ERP unavailable")
+
+    client = BatchingERPClient(FailingERPClient())
+
+    with pytest.raises(ConnectionError):
+        await client.update_invoice("INV002", {"state": "draft"})
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_setup_problems_concurrently(tmp_path):
+    """Test that concurrent setups share bulk writes to the ERP system."""
+    benchmark = ERPWorkflowBenchmark()
+    inner = RecordingERPClient()
+    benchmark.erp_client = BatchingERPClient(inner, max_delay=0.05)
+
+    problem_dirs = [tmp_path / p.problem_id for p in benchmark.problems]
+    for problem_dir in problem_dirs:
+        problem_dir.mkdir()
+
+    await asyncio.gather(*(
+        benchmark.setup_problem(problem, problem_dir, "test_container")
+        for problem, problem_dir in zip(benchmark.problems, problem_dirs)
+    ))
+    await benchmark.erp_client.aclose()
+
+    assert sorted(inner.bulk_writes) == [
+        ("account.move", [("INV002", {"state": "draft"})]),
+        ("sale.order", [("SO001", {"discount": 0.0, "state": "draft"})]),
+    ]
+    assert all((problem_dir / "erp_config.json").exists() for problem_dir in problem_dirs)
+
+
+class PerRecordERPClient(ERPClient):
+    """Mock ERP client with only a per-record sale order write."""
+
+    def __init__(self):
+        super().__init__("http://erp.test", "test_key", "test_db")
+        self.writes = []
+
+    async def _write_sale_order(self, order_id, values):
+        self.writes.append((order_id, values))
+        return True
+
+
+@pytest.mark.asyncio
+async def test_bulk_write_defaults_to_per_record_writes(tmp_path):
+    """Test that batched setup writes reach per-record write overrides."""
+    benchmark = ERPWorkflowBenchmark()
+    inner = PerRecordERPClient()
+    benchmark.erp_client = BatchingERPClient(inner)
+
+    await benchmark.setup_problem(
+        benchmark.get_problem("update_discount_001"), tmp_path, "test_container"
+    )
+    await benchmark.erp_client.aclose()
+
+    assert inner.writes == [("SO001", {"discount": 0.0, "state": "draft"})]
+
+
+class CountingERPClient(ERPClient):
+    """Mock ERP client that counts the reads that reach the ERP system."""
+
+    def __init__(self, **kwargs):
+        super().__init__("http://erp.test", "test_key", "test_db", **kwargs)
+        self.fetches = 0
+
+    async def _fetch_sale_order(self, order_id):
+        self.fetches += 1
+        return await super()._fetch_sale_order(order_id)
+
+
+@pytest.mark.asyncio
+async def test_reads_are_cached():
+    """Test that repeated reads of an entity are served from the cache."""
+    client = CountingERPClient()
+
+    orders = await asyncio.gather(*(client.get_sale_order("SO001") for _ in range(3)))
+    orders.append(await client.get_sale_order("SO001"))
+
+    assert client.fetches == 1
+    assert all(order is orders[0] for order in orders)
+
+    await client.get_sale_order("SO002")
+    assert client.fetches == 2
+
+
+@pytest.mark.asyncio
+async def test_writes_invalidate_cached_reads():
+    """Test that updating an entity, directly or in bulk, drops its cached read."""
+    client = CountingERPClient()
+
+    await client.get_sale_order("SO001")
+    await client.update_sale_order("SO001", {"discount": 10.0})
+    await client.get_sale_order("SO001")
+    assert client.fetches == 2
+
+    await client.bulk_write("sale.order", [("SO001", {"discount": 0.0})])
+    await client.get_sale_order("SO001")
+    assert client.fetches == 3
+
+
+@pytest.mark.asyncio
+async def test_cached_reads_expire():
+    """Test that cached reads are refetched once their TTL has passed."""
+    client = CountingERPClient(cache_ttl=0.0)
+
+    await client.get_sale_order("SO001")
+    await client.get_sale_order("SO001")
+    assert client.fetches == 2
+
+
+@pytest.mark.asyncio
+async def test_setup_writes_supporting_files(tmp_path):
+    """Test that setup writes the config, README and supporting files."""
+    benchmark = ERPWorkflowBenchmark()
+    problem = benchmark.get_problem("update_credit_003")
+
+    await benchmark.setup_problem(problem, tmp_path, "test_container")
+    await benchmark.aclose()
+
+    config = fast_json.loads((tmp_path / "erp_config.json").read_bytes())
+    assert config["entity_id"] == "CUST003"
+    assert "50000.00" in (tmp_path / "approvals" / "credit_approval_003.pdf").read_text()
+    assert problem.statement in (tmp_path / "README.md").read_text()
+
+
+def test_compiled_verifier_scores_expected_changes():
+    """Test that a compiled verifier scores and reports each expected field."""
+    verify = _compile_verifier({"discount": 10.0, "state": "draft", "note": "a'{b}"})
+
+    assert verify({"discount": 10.0, "state": "draft", "note": "a'{b}"}) == (1.0, None)
+    assert verify({"discount": 0.0, "state": "draft"}) == (
+        1 / 3,
+        "discount: expected 10.0, got 0.0; note: expected a'{b}, got None",
+    )
+
+
+@pytest.mark.asyncio
+async def test_score_invoice_changes(tmp_path):
+    """Test that invoice changes are verified against the ERP system."""
+    benchmark = ERPWorkflowBenchmark()
+    problem = benchmark.get_problem("confirm_invoice_002")
+    (tmp_path / "answer.txt").write_text("COMPLETED")
+
+    score, error, _ = await benchmark.score_problem(
+        problem, str(tmp_path), str(tmp_path), "test_container"
+    )
+
+    # The mock ERP client always returns a draft invoice
+    assert score == 0.0
+    assert error == "state: expected posted, got draft"
+
+
+@pytest.mark.asyncio
+async def test_score_no_answer_file(tmp_path):
+    """Test scoring when answer.txt is missing."""
+    benchmark = ERPWorkflowBenchmark()
+    problem = benchmark.get_problem("update_discount_001")
+
+    score, error, _ = await benchmark.score_problem(
+        problem, str(tmp_path), str(tmp_path), "test_container"
+    )
+
+    assert score == 0.0
+    assert "answer.txt" in error
+
+
+@pytest.mark.asyncio
+async def test_score_reports_failed_entity_fetch(tmp_path):
+    """Test that an ERP error while fetching the entity is reported."""
+    class UnreachableERPClient(ERPClient):
+        async def _fetch_sale_order(self, order_id):
+            raise ConnectionError("ERP unavailable")
+
+    benchmark = ERPWorkflowBenchmark()
+    benchmark.erp_client = UnreachableERPClient("http://erp.test", "test_key")
+    problem = benchmark.get_problem("update_discount_001")
+    (tmp_path / "answer.txt").write_text("DONE")
+
+    score, error, _ = await benchmark.score_problem(
+        problem, str(tmp_path), str(tmp_path), "test_container"
+    )
+
+    assert score == 0.0
+    assert error == "Failed to query sale order: ERP unavailable"
+
+
+@pytest.mark.asyncio
+async def test_batching_client_close_fails_pending_writes():
+    """Test that closing during a bulk write fails every pending update."""
+    started = asyncio.Event()
+
+    class SlowERPClient(RecordingERPClient):
+        async def bulk_write(self, model, writes):
+            started.set()
+            await asyncio.sleep(60)
+
+    client = BatchingERPClient(SlowERPClient(), batch_size=1, max_delay=0.0)
+    updates = [
+        asyncio.create_task(client.update_sale_order(f"SO00{i}", {"state": "draft"}))
+        for i in range(3)
+    ]
+    await started.wait()
+    await client.aclose()
+
+    results = await asyncio.wait_for(
+        asyncio.gather(*updates, return_exceptions=True), timeout=1
+    )
+    assert all(isinstance(result, ERPClientClosedError) for result in results)
+
+
+class StatefulERPClient(ERPClient):
+    """Mock ERP client holding sale orders, whose writes take a while."""
+
+    def __init__(self):
+        super().__init__("http://erp.test", "test_key", "test_db")
+        self.orders = {"SO001": {"discount": 0.0}}
+
+    async def _fetch_sale_order(self, order_id):
+        await asyncio.sleep(0.01)
+        return dict(self.orders[order_id])
+
+    async def _write_sale_order(self, order_id, values):
+        await asyncio.sleep(0.02)
+        self.orders[order_id].update(values)
+        return True
+
+
+@pytest.mark.asyncio
+async def test_reads_overlapping_a_write_are_not_cached():
+    """Test that a read racing a write doesn't cache the old record."""
+    client = StatefulERPClient()
+
+    await asyncio.gather(
+        client.update_sale_order("SO001", {"discount": 10.0}),
+        client.get_sale_order("SO001"),
+    )
+
+    assert await client.get_sale_order("SO001") == {"discount": 10.0}
+
+
+@pytest.mark.asyncio
+async def test_invalidate_drops_search_locks():
+    """Test that writes drop the locks of the searches they invalidate."""
+    client = ERPClient("http://erp.test", "test_key")
+
+    for day in range(5):
+        await client.search_entities("sale.order", [("delivery_date", "=", f"2026-03-{day:02}")])
+    await client.update_sale_order("SO001", {"state": "draft"})
+
+    assert not client._cache
+    assert not client._cache_locks
+
+
+def test_setup_files_follow_umask(tmp_path):
+    """Test that setup files get the same permissions as open() would give."""
+    umask = os.umask(0o002)
+    try:
+        _write_file(os.path.join(tmp_path, "erp_config.json"), b"{}")
+    finally:
+        os.umask(umask)
+
+    assert (tmp_path / "erp_config.json").stat().st_mode & 0o777 == 0o664
+
+
+@pytest.mark.asyncio
+async def test_verify_fetches_entity_when_not_given():
+    """Test that the verifiers fetch the entity themselves if it isn't passed."""
+    benchmark = ERPWorkflowBenchmark()
+
+    score, error = await benchmark._verify_sale_order_changes(
+        benchmark.get_problem("update_discount_001"), "DONE"
+    )
+    # The mock ERP client returns an order without a discount
+    assert score == 0.5
+    assert error == "discount: expected 10.0, got None"
+
+    score, error = await benchmark._verify_invoice_changes(
+        benchmark.get_problem("confirm_invoice_002"), "COMPLETED"
+    )
+    assert (score, error) == (0.0, "state: expected posted, got draft")
+
+
+@pytest.mark.asyncio
+async def test_setup_config_follows_replaced_client(tmp_path):
+    """Test that erp_config.json describes the client the benchmark now uses."""
+    benchmark = ERPWorkflowBenchmark()
+    benchmark.erp_client = ERPClient("http://other-erp.test", "other_key", "other_db")
+
+    await benchmark.setup_problem(
+        benchmark.get_problem("update_discount_001"), tmp_path, "test_container"
+    )
+
+    config = fast_json.loads((tmp_path / "erp_config.json").read_bytes())
+    assert (config["url"], config["api_key"], config["database"]) == (
+        "http://other-erp.test", "other_key", "other_db"
+    )
+
+
+@pytest.mark.asyncio
+async def test_cache_size_zero_disables_caching():
+    """Test that a cache_size of 0 turns caching off."""
+    client = CountingERPClient(cache_size=0)
+
+    await client.get_sale_order("SO001")
+    await client.get_sale_order("SO001")
+    await client.search_entities("sale.order", [])
+
+    assert client.fetches == 2
+    assert not client._cache
+    assert not client._cache_locks
+
+
+@pytest.mark.asyncio
+async def test_uncached_reads_leave_no_bookkeeping():
+    """Test that failed and invalidated reads don't leave locks or counters behind."""
+    class FlakyERPClient(StatefulERPClient):
+        async def _fetch_invoice(self, invoice_id):
+            raise ConnectionError("ERP unavailable")
+
+    client = FlakyERPClient()
+
+    for i in range(5):
+        with pytest.raises(ConnectionError):
+            await client.get_invoice(f"INV00{i}")
+    await asyncio.gather(
+        client.update_sale_order("SO001", {"discount": 10.0}),
+        client.get_sale_order("SO001"),
+    )
+
+    assert not client._cache
+    assert not client._cache_locks
+    assert not client._fetching
+    assert not client._generations
+
+
+@pytest.mark.asyncio
+async def test_replaced_problem_uses_its_own_fields(tmp_path):
+    """Test that a problem derived with replace() isn't set up or scored as the original."""
+    benchmark = ERPWorkflowBenchmark()
+    problem = replace(
+        benchmark.get_problem("confirm_invoice_002"),
+        statement="Locate invoice INV009 and leave it in draft.",
+        entity_id="INV009",
+        expected_changes={"state": "draft"},
+    )
+
+    await benchmark.setup_problem(problem, tmp_path, "test_container")
+    await benchmark.aclose()
+    config = fast_json.loads((tmp_path / "erp_config.json").read_bytes())
+    assert config["entity_id"] == "INV009"
+    assert problem.statement in (tmp_path / "README.md").read_text()
+
+    (tmp_path / "answer.txt").write_text("COMPLETED")
+    score, error, _ = await benchmark.score_problem(
+        problem, str(tmp_path), str(tmp_path), "test_container"
+    )
+    # The mock ERP client always returns a draft invoice
+    assert (score, error) == (1.0, None)
+
+
+@pytest.mark.asyncio
+async def test_aclose_with_plain_client():
+    """Test that the benchmark can be closed when its client isn't batched."""
+    benchmark = ERPWorkflowBenchmark()
+    benchmark.erp_client = ERPClient("http://erp.test", "test_key")
+
+    await benchmark.aclose()
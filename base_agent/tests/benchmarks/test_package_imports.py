@@ -0,0 +1,39 @@
+# Self-Improving Coding Agent
+# Copyright (c) 2025 Maxime Robeyns
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+"""Tests for the lazy benchmark imports in the src.benchmarks package."""
+import sys
+import subprocess
+from pathlib import Path
+
+BASE_AGENT_DIR = Path(__file__).parents[2]
+
+# Run in a fresh interpreter, since this test session has usually imported
+# benchmark modules already
+CHECK_LAZY_IMPORTS = """
+import sys
+import src.benchmarks
+
+unused = ["gpqa", "aime", "math", "humaneval", "data_transform"]
+loaded = [m for m in unused if f"src.benchmarks.{m}" in sys.modules]
+assert not loaded, f"Imported eagerly: {loaded}"
+
+assert "DataTransformBenchmark" not in vars(src.benchmarks)
+from src.benchmarks import DataTransformBenchmark
+from src.benchmarks.data_transform import DataTransformBenchmark as cls
+assert DataTransformBenchmark is cls
+assert vars(src.benchmarks)["DataTransformBenchmark"] is cls
+"""
+
+
+def test_benchmark_modules_are_imported_on_first_access():
+    """Test that importing the package only loads the registered benchmarks."""
+    result = subprocess.run(
+        [sys.executable, "-c", CHECK_LAZY_IMPORTS],
+        cwd=BASE_AGENT_DIR,
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr
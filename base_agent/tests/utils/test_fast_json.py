@@ -0,0 +1,65 @@
+# Self-Improving Coding Agent
+# Copyright (c) 2025 Maxime Robeyns
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+"""
+Tests for the fast_json utilities module.
+"""
+import json
+import pytest
+
+from src.utils import fast_json
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def backend(request, monkeypatch):
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(fast_json, "orjson", None)
+    return request.param
+
+
+@pytest.mark.parametrize("indent", [False, True])
+def test_dumps_round_trip(backend, indent):
+    data = [{"name": "Alice", "age": 25}, {"amount": 50.25, "tags": ["a", "é"]}]
+    encoded = fast_json.dumps(data, indent=indent)
+    assert isinstance(encoded, bytes)
+    assert json.loads(encoded) == data
+    assert fast_json.loads(encoded) == data
+    assert fast_json.loads(encoded.decode()) == data
+
+
+def test_dumps_indent(backend):
+    assert fast_json.dumps({"a": 1}, indent=True) == b'{\n  "a": 1\n}'
+
+
+def test_loads_invalid_raises_json_decode_error(backend):
+    with pytest.raises(json.JSONDecodeError):
+        fast_json.loads(b"{not json")
+
+
+def test_loads_invalid_utf8_raises_json_decode_error(backend):
+    with pytest.raises(json.JSONDecodeError):
+        fast_json.loads(b'{"name": "\xff"}')
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64, 4096])
+def test_iter_jsonl_arbitrary_chunking(chunk_size):
+    records = [{"id": str(i), "question": "q" * i} for i in range(20)]
+    content = b"".join(fast_json.dumps(r) + b"\n" for r in records)
+    chunks = (
+        content[i : i + chunk_size] for i in range(0, len(content), chunk_size)
+    )
+    assert list(fast_json.iter_jsonl(chunks)) == records
+
+
+def test_iter_jsonl_skips_blank_lines_and_unterminated_tail():
+    chunks = [b'{"a": 1}\n\n', b"  \n", b'{"a"', b": 2}\r\n", b'{"a": 3}']
+    assert list(fast_json.iter_jsonl(chunks)) == [{"a": 1}, {"a": 2}, {"a": 3}]
+
+
+def test_iter_jsonl_empty():
+    assert list(fast_json.iter_jsonl([])) == []
+    assert list(fast_json.iter_jsonl([b"", b"\n"])) == []
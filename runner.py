@@ -55,6 +55,17 @@ def setup_argparse() -> argparse.ArgumentParser:
     parser.add_argument(
         "--workers", type=int, default=8, help="Number of parallel problem workers"
     )
+    parser.add_argument(
+        "--problem-data-dir",
+        type=Path,
+        default=None,
+        help=(
+            "Base directory for the per-problem data directories mounted into "
+            "the agent containers (default: <experiment dir>/problem_data). "
+            "Directories are created under <dir>/run_<id>. Point this at a "
+            "tmpfs mount, e.g. /dev/shm/sica, to keep problem fixtures in memory."
+        ),
+    )
     subparsers = parser.add_subparsers(dest="command", help="Sub-command to perform")
 
     # Just run through a single benchmark for testing
@@ -362,6 +373,7 @@ async def process_job(
     agent_dir: Path,
     job: Job,
     worker_id: int,
+    problem_data_root: Path | None = None,
 ) -> bool:
     """Process a single benchmark problem job"""
     TIMEOUT_SECONDS = 10 * 60  # 10 minutes timeout
@@ -393,7 +405,12 @@ async def process_job(
 
     # Create problem data directory
     dirname = re.sub(r"[^a-zA-Z0-9_]", "", f"{benchmark.name}_{problem.problem_id}")
-    problem_data_dir = exp_dir / "problem_data" / dirname
+    if problem_data_root is None:
+        problem_data_dir = exp_dir / "problem_data" / dirname
+    else:
+        # Namespace by run, so that concurrent runs sharing a root don't
+        # remove each other's problem directories
+        problem_data_dir = problem_data_root / exp_dir.name / dirname
     if problem_data_dir.exists():
         shutil.rmtree(problem_data_dir)
     problem_data_dir.mkdir(parents=True)
@@ -647,6 +664,7 @@ async def run_benchmarks_with_job_queue(
     agent_dir: Path,
     benchmarks: list[Type[BaseBenchmark]],
     max_workers: int = 6,
+    problem_data_root: Path | None = None,
 ) -> None:
     """Run multiple benchmarks concurrently using a job queue approach"""
 
@@ -702,6 +720,7 @@ async def run_benchmarks_with_job_queue(
         logger.info("No problems to process, all benchmarks are complete")
         # Generate final perf reports for each benchmark
         for benchmark_name, benchmark in benchmarks_dict.items():
+            await benchmark.aclose()
             await generate_benchmark_statistics(agent_dir, benchmark_name)
         return
 
@@ -718,7 +737,9 @@ async def run_benchmarks_with_job_queue(
                 try:
                     # Process the job
                     logger.info(f"Worker {worker_id} processing job {job}")
-                    await process_job(exp_dir, agent_dir, job, worker_id)
+                    await process_job(
+                        exp_dir, agent_dir, job, worker_id, problem_data_root
+                    )
                 except Exception as e:
                     logger.error(f"Error in worker {worker_id} processing {job}: {e}")
                 finally:
@@ -745,6 +766,7 @@ async def run_benchmarks_with_job_queue(
 
     # Generate final perf reports for each benchmark
     for benchmark_name, benchmark in benchmarks_dict.items():
+        await benchmark.aclose()
         await generate_benchmark_statistics(agent_dir, benchmark_name)
 
 
@@ -1011,7 +1033,11 @@ async def main():
 
         # Run the specified benchmark using the job queue approach
         await run_benchmarks_with_job_queue(
-            exp_dir, latest_agent, [benchmark_cls], args.workers
+            exp_dir,
+            latest_agent,
+            [benchmark_cls],
+            args.workers,
+            args.problem_data_dir,
         )
         return
 
@@ -1028,7 +1054,11 @@ async def main():
         # Run all benchmarks concurrently using job queue
         logger.info(f"Running benchmarks for iteration {i}")
         await run_benchmarks_with_job_queue(
-            exp_dir, current_agent_dir, list(benchmark_registry.values()), args.workers
+            exp_dir,
+            current_agent_dir,
+            list(benchmark_registry.values()),
+            args.workers,
+            args.problem_data_dir,
         )
 
         # Improvement task